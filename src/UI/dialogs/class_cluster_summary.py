@@ -1,9 +1,52 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView
 )
 
 
+class ParamSummaryModel(QAbstractTableModel):
+    """Table model holding the per-parameter (average, std) summary rows."""
+
+    HEADERS = ('Parameter', 'Average', 'Std Dev')
+
+    def __init__(self, parameter_data=None, parent=None):
+        super().__init__(parent)
+        self._rows = list((parameter_data or {}).items())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            param, (avg, std) = self._rows[index.row()]
+            column = index.column()
+            if column == 0:
+                return param.capitalize()
+            if column == 1:
+                return f"{avg:.2f}"
+            return f"{std:.2f}"
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def set_parameter_data(self, parameter_data):
+        """Replaces all rows with a single model reset."""
+        self.beginResetModel()
+        self._rows = list(parameter_data.items())
+        self.endResetModel()
+
+
 class ClassClusterSummary(QWidget):
     """Widget for displaying a summary of a class or cluster."""
 
@@ -20,39 +63,27 @@ class ClassClusterSummary(QWidget):
         # Title label
         self.title_label = QLabel(title, self)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("font-size: 18pt; font-weight: bold;")
+        self.title_label.setObjectName("SummaryTitle")
         self.layout.addWidget(self.title_label)
 
         # Number of samples label
         self.samples_label = QLabel("Number of samples: 0", self)
         self.samples_label.setAlignment(Qt.AlignCenter)
-        self.samples_label.setStyleSheet("font-size: 12pt; color: gray;")
+        self.samples_label.setObjectName("SummarySamples")
         self.layout.addWidget(self.samples_label)
 
-        # Table widget setup
-        self.table_widget = QTableWidget(self)
-        self.table_widget.setColumnCount(3)
-        self.table_widget.setHorizontalHeaderLabels(['Parameter', 'Average', 'Std Dev'])
-        self.table_widget.verticalHeader().setVisible(False)
-        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table_widget.setSelectionMode(QTableWidget.NoSelection)
-        self.table_widget.setStyleSheet("""
-            QTableWidget {
-                background-color: #FFFFFF;
-                border: 1px solid #CCCCCC;
-            }
-            QTableWidget::item {
-                padding: 8px;
-            }
-            QHeaderView::section {
-                background-color: #F5F5F5;
-                padding: 8px;
-                font-weight: bold;
-                border: 1px solid #CCCCCC;
-            }
-        """)
-        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.layout.addWidget(self.table_widget)
+        # Table view setup
+        self.table_model = ParamSummaryModel(parent=self)
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.table_model)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.setEditTriggers(QTableView.NoEditTriggers)
+        self.table_view.setSelectionMode(QTableView.NoSelection)
+        self.table_view.setObjectName("SummaryTable")
+        # Columns are sized once per population (see set_summary_data) rather than on every layout pass
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.layout.addWidget(self.table_view)
 
         # Optional: Add a footer or additional information if needed
         # self.footer_label = QLabel("Additional Info", self)
@@ -74,17 +105,12 @@ class ClassClusterSummary(QWidget):
         self.title_label.setText(f"{name} Summary")
         self.samples_label.setText(f"Number of samples: {num_samples}")
 
-        self.table_widget.setRowCount(len(parameter_data))
-        for row, (param, (avg, std)) in enumerate(parameter_data.items()):
-            param_item = QTableWidgetItem(param.capitalize())
-            avg_item = QTableWidgetItem(f"{avg:.2f}")
-            std_item = QTableWidgetItem(f"{std:.2f}")
-
-            # Center align the text
-            param_item.setTextAlignment(Qt.AlignCenter)
-            avg_item.setTextAlignment(Qt.AlignCenter)
-            std_item.setTextAlignment(Qt.AlignCenter)
-
-            self.table_widget.setItem(row, 0, param_item)
-            self.table_widget.setItem(row, 1, avg_item)
-            self.table_widget.setItem(row, 2, std_item)
+        # Suspend repaints and sorting while the model is reset so the view
+        # performs a single layout pass for the whole table.
+        self.table_view.setUpdatesEnabled(False)
+        self.table_view.setSortingEnabled(False)
+        try:
+            self.table_model.set_parameter_data(parameter_data)
+            self.table_view.resizeColumnsToContents()
+        finally:
+            self.table_view.setUpdatesEnabled(True)
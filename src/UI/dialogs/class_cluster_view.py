@@ -1,12 +1,15 @@
 ### UI/class_cluster_viewer.py
+import logging
+from collections import defaultdict
+
 from PySide6.QtCore import QSize
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QListView
 from PySide6.QtWidgets import QMenu
-# import qspaceritem, qsizepolicy, qscrollarea, qslider, qhboxlayout, qvboxlayout, qwidget, qlabel
+# import qspaceritem, qsizepolicy, qslider, qhboxlayout, qvboxlayout, qwidget, qlabel
 from PySide6.QtWidgets import QSpacerItem, QSizePolicy, QHBoxLayout
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from UI.navigation_interface.workspace.views.gallery.gallery_delegate import GalleryDelegate
 # from UI.navigation_interface.workspace.views.gallery.gallery import GalleryView
 from UI.navigation_interface.workspace.views.gallery.image_card import ImageCard
@@ -14,6 +17,29 @@ from backend.presenters.gallery_model import GalleryModel
 from qfluentwidgets import Slider
 
 
+class CardLoaderSignals(QObject):
+    ready = Signal(object)  # Emitting each constructed ImageCard
+
+
+class CardLoader(QRunnable):
+    """Builds ImageCards (which touch the filesystem) on a pool thread."""
+
+    def __init__(self, card_fields, signals):
+        super().__init__()
+        self.card_fields = card_fields  # List of ImageCard keyword-argument dicts
+        self.signals = signals
+
+    @Slot()
+    def run(self):
+        for fields in self.card_fields:
+            try:
+                card = ImageCard(**fields)
+            except Exception as e:
+                logging.error(f"Error creating card for sample {fields['id']}: {e}")
+                continue
+            self.signals.ready.emit(card)
+
+
 # Doing like that for now because did not figure out the context menu handling for the class-cluster viewer yet.
 class GalleryView(QListView):
     """
@@ -29,9 +55,8 @@ class GalleryView(QListView):
         """
         super().__init__(parent)
 
-        # Initialize the model
-        self.model = GalleryModel()
-        self.setModel(self.model)
+        # The model is created on first access (see the model property)
+        self._model = None
 
         # Initialize the delegate
         self.delegate = GalleryDelegate(self)
@@ -42,7 +67,10 @@ class GalleryView(QListView):
         self.setFlow(QListView.LeftToRight)
         self.setResizeMode(QListView.Adjust)
         self.setSpacing(10)
-        self.setUniformItemSizes(False)
+        # All cards share the delegate's card size, so layout can be computed arithmetically
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
         self.setSelectionMode(QListView.ExtendedSelection)
         self.setMovement(QListView.Static)
         self.setWrapping(True)
@@ -60,6 +88,14 @@ class GalleryView(QListView):
         # Optional: Set minimum size
         self.setMinimumSize(200, 200)
 
+    @property
+    def model(self):
+        """The GalleryModel backing the view, created and attached on first access."""
+        if self._model is None:
+            self._model = GalleryModel()
+            self.setModel(self._model)
+        return self._model
+
 class ClassClusterViewer(QWidget):
     """Widget for viewing the contents of a class or cluster."""
 
@@ -76,8 +112,7 @@ class ClassClusterViewer(QWidget):
         # Set initial geometry
         self.setGeometry(200, 200, 800, 600)
 
-        # set fluent design style
-        self.setStyleSheet("background-color: #FFF; color: #000;")
+        # Fluent design style is provided by the application stylesheet (ClassClusterViewer selector)
 
         # Scale controls layout
         self.scale_controls_layout = QHBoxLayout()
@@ -86,90 +121,148 @@ class ClassClusterViewer(QWidget):
         self.scale_slider.setRange(50, 200)
         self.scale_slider.setValue(100)  # Default scale
         self.scale_slider.setFixedWidth(200)  # Adjust width as needed
+        self.scale_value_label = QLabel("100%", self)
         spacer_left = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
         spacer_right = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
         self.scale_controls_layout.addItem(spacer_left)
         self.scale_controls_layout.addWidget(self.scale_label)
         self.scale_controls_layout.addWidget(self.scale_slider)
+        self.scale_controls_layout.addWidget(self.scale_value_label)
         self.scale_controls_layout.addItem(spacer_right)
 
         self.layout.addLayout(self.scale_controls_layout) # Add scale controls at the top
         self.layout.addWidget(self.label)  # Title label remains below the slider
 
-        # Initialize GalleryView and GalleryDelegate
+        # Initialize GalleryView (it installs its own GalleryDelegate)
         self.gallery_view = GalleryView(self)
-        self.gallery_delegate = GalleryDelegate(self.gallery_view)
-        self.gallery_view.setItemDelegate(self.gallery_delegate)
-
-        self.scroll_area = QScrollArea(self)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.gallery_view)
-        self.layout.addWidget(self.scroll_area)
-
-        # Connect slider
-        self.scale_slider.valueChanged.connect(self.resize_tiles)
+        self.layout.addWidget(self.gallery_view)  # QListView scrolls its own viewport
+
+        # Connect slider (debounced so a drag triggers a single relayout)
+        self._pending_size = self.scale_slider.value()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(60)
+        self._resize_timer.timeout.connect(lambda: self._do_resize_tiles(self._pending_size))
+        self.scale_slider.valueChanged.connect(self._schedule_resize)
+        self.scale_slider.sliderReleased.connect(lambda: self.resize_tiles(self.scale_slider.value()))
+
+        # Context menu is built lazily and rebuilt only after the set of classes changes
+        self._assign_menu = None
+        self._assign_menu_dirty = True
+        data_manager = self.presenter.data_manager
+        data_manager.class_added.connect(self._invalidate_assign_menu)
+        data_manager.class_updated.connect(self._invalidate_assign_menu)
+        data_manager.class_deleted.connect(self._invalidate_assign_menu)
+
+        # Cards are built off the UI thread and inserted in ~50 ms batches
+        self._card_buffer = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_cards)
+        self._loader_signals = CardLoaderSignals()
+        self._loader_signals.ready.connect(self._on_card_ready, Qt.QueuedConnection)
 
         # Resize tiles (initial size)
         self.resize_tiles(100)
 
-    def add_card(self, image_id: str):  # Add type hint
-        """Adds an ImageCard to the viewer immediately."""
-        # Retrieve image data from the presenter's DataManager
+    def _card_fields(self, image_id: str) -> dict:
+        """Collects the ImageCard constructor arguments for the given sample."""
+        # Retrieve image data from the presenter's DataManager (on the UI thread)
         image_data = self.presenter.data_manager.samples[image_id]
         class_color = self.presenter.data_manager.classes[image_data.class_id].color if image_data.class_id else None
-        try:
-            image = ImageCard(id=image_id,
-                            name=image_id[:8],
-                            path=image_data.path,
-                            mask_path=self.presenter.data_manager.masks[image_data.mask_id].masked_image_path,
-                            class_id=image_data.class_id,
-                            class_color=class_color
-                            )
-        except Exception as e:
-            image = ImageCard(id=image_id,
-                                        name=image_id[:8],
-                                        path=image_data.path,
-                                        mask_path=None,
-                                        class_id=image_data.class_id,
-                                        class_color=class_color
-                                        )
+        mask = self.presenter.data_manager.masks.get(image_data.mask_id) if image_data.mask_id else None
+        mask_path = mask.masked_image_path if mask else None
+
+        return dict(id=image_id,
+                    name=image_id[:8],
+                    path=image_data.path,
+                    mask_path=mask_path,
+                    class_id=image_data.class_id,
+                    class_color=class_color)
+
+    def add_card(self, image_id: str):  # Add type hint
+        """Queues an ImageCard to be built in the background and added to the viewer."""
+        self.add_cards([image_id])
+
+    def add_cards(self, image_ids: list[str]):
+        """Queues ImageCards for all given samples; they are inserted in batches as they are built."""
+        loader = CardLoader([self._card_fields(image_id) for image_id in image_ids], self._loader_signals)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_card_ready(self, card):
+        """Buffers a card built by a CardLoader until the next flush."""
+        self._card_buffer.append(card)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_cards(self):
+        """Inserts all buffered cards into the model at once."""
+        if not self._card_buffer:
+            return
+        cards, self._card_buffer = self._card_buffer, []
+        self.gallery_view.model.addImages(cards)
 
-        self.gallery_view.model.addImage(image)
+    def _schedule_resize(self, new_size):
+        """Coalesces rapid slider changes into a single resize."""
+        self.scale_value_label.setText(f"{new_size}%")
+        self._pending_size = new_size
+        if self.scale_slider.isSliderDown():
+            return  # Relayout once on sliderReleased instead of during the drag
+        self._resize_timer.start()
 
     def resize_tiles(self, new_size):
+        """Resizes the tiles immediately, dropping any pending debounced resize."""
+        self._resize_timer.stop()
+        self._do_resize_tiles(new_size)
+
+    def _do_resize_tiles(self, new_size):
         new_width = 100 * new_size / 100
         aspect_ratio = 1.3  # Or calculate from initial image size
         new_height = new_width * aspect_ratio
 
-        self.gallery_delegate.set_card_size(QSize(new_width, new_height))
+        self.gallery_view.delegate.set_card_size(QSize(new_width, new_height))
         grid_size = QSize(new_width + self.gallery_view.spacing(), new_height + self.gallery_view.spacing()) #Corrected attribute
-        self.gallery_view.setGridSize(grid_size)
-        self.gallery_view.doItemsLayout()
+        self.gallery_view.setGridSize(grid_size)  # Schedules a delayed relayout
         self.gallery_view.viewport().update()  # Ensure update
 
+    def _invalidate_assign_menu(self, *_):
+        """Marks the cached context menu as stale."""
+        self._assign_menu_dirty = True
+
+    def _build_assign_menu(self):
+        """(Re)builds the cached "Assign Class" context menu."""
+        if self._assign_menu is not None:
+            self._assign_menu.deleteLater()
+
+        menu = QMenu(self)
+        menu.setObjectName("AssignClassMenu")
+        assign_class_menu = menu.addMenu("Assign Class")
+
+        for class_object in self.presenter.data_manager.classes.values():
+            action = QAction(class_object.name, menu)
+            action.setData(class_object.name)
+            action.triggered.connect(self._on_assign)
+            assign_class_menu.addAction(action)
+
+        self._assign_menu = menu
+        self._assign_menu_dirty = False
+
+    def _on_assign(self):
+        """Shared slot for all "Assign Class" actions; the class name is stored in the action data."""
+        self.assign_class_to_selected(self.sender().data())
+
     def contextMenuEvent(self, event):
         index = self.gallery_view.indexAt(event.pos())
         if index.isValid():
-            menu = QMenu(self)
-            menu.setStyleSheet("QMenu {background-color: #234f4b; color: white;}")
-            assign_class_menu = menu.addMenu("Assign Class")
-
-            for class_object in self.presenter.data_manager.classes.values():
-                action = QAction(class_object.name, menu)
-                action.triggered.connect(
-                    lambda checked=False, name=class_object.name:
-                    self.assign_class_to_selected(name)
-                )
-                assign_class_menu.addAction(action)
-
-            menu.exec_(event.globalPos())
+            if self._assign_menu_dirty:
+                self._build_assign_menu()
+            self._assign_menu.exec_(event.globalPos())
 
     def assign_class_to_selected(self, class_name):
         """Assigns the selected samples in the viewer to the given class."""
         selected_indexes = self.gallery_view.selectionModel().selectedIndexes()
-        image_ids = [index.data(Qt.UserRole).id for index in selected_indexes]
-
-        if not image_ids:
+        if not selected_indexes:
             return
 
         class_object = self.presenter.data_manager.get_class_by_name(class_name)  # Access data_manager through presenter
@@ -178,18 +271,20 @@ class ClassClusterViewer(QWidget):
             return
 
         try:
-            # REMOVE FROM OLD CLASSES
-            old_classes_to_images = {}
-            for image_id in image_ids:
-                image = self.presenter.data_manager.get_image(image_id)
-                old_class_id = image.class_id
-
-                if old_class_id:
-                    if old_class_id not in old_classes_to_images:
-                        old_classes_to_images[old_class_id] = []
-                    old_classes_to_images[old_class_id].append(image_id)
-
-            # Now remove images from the old classes
+            # Single pass: collect cards and ids, grouping images by the class they leave
+            cards = []
+            image_ids = []
+            old_classes_to_images = defaultdict(list)
+            for index in selected_indexes:
+                card = index.data(Qt.UserRole)
+                cards.append(card)
+                image_ids.append(card.id)
+
+                old_class_id = self.presenter.data_manager.get_image(card.id).class_id
+                if old_class_id and old_class_id != class_object.id:
+                    old_classes_to_images[old_class_id].append(card.id)
+
+            # REMOVE FROM OLD CLASSES (images already in the target class are left alone)
             for old_class_id, images_to_remove in old_classes_to_images.items():
                 self.presenter.data_manager.remove_images_from_class(images_to_remove, old_class_id)
 
@@ -203,8 +298,8 @@ class ClassClusterViewer(QWidget):
             self.presenter.class_updated.emit(class_object.id)
 
             # Update card colors in the viewer:
-            for index in selected_indexes:
-                card = index.data(Qt.UserRole)
+            for card in cards:
+                card.class_id = class_object.id
                 card.class_color = class_object.color
             self.gallery_view.viewport().update()
 
@@ -26,9 +26,9 @@ class ExportDialog(MessageBoxBase):
         self.includeChartsCheckBox = CheckBox("Include Charts", self)
         self.includeCalculatedParamsCheckBox = CheckBox("Include Calculated Parameters (.csv)", self)
 
-        # Apply font size adjustments for better visibility
-        self.descriptionLabel.setStyleSheet("font-size: 16px; font-weight: bold;")
-        self.folderPathLabel.setStyleSheet("font-size: 14px; color: #555;")
+        # Font size adjustments for better visibility live in the application stylesheet
+        self.descriptionLabel.setObjectName("ExportTitle")
+        self.folderPathLabel.setObjectName("ExportFolderPath")
         checkboxes = [
             self.includeClustersCheckBox,
             self.includeMasksCheckBox,
@@ -36,7 +36,7 @@ class ExportDialog(MessageBoxBase):
             self.includeCalculatedParamsCheckBox
         ]
         for cb in checkboxes:
-            cb.setStyleSheet("font-size: 14px;")
+            cb.setObjectName("ExportCheckbox")
 
         # Initialize layout
         self.__initWidget()
@@ -1,5 +1,6 @@
+import logging
+
 from PySide6.QtCore import QUrl, Qt
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 
 
@@ -11,8 +12,9 @@ class PlotViewerWidget(QWidget):
         self.setWindowFlags(Qt.Window)  # Set window flags to make it a separate window
         self.setWindowTitle("Plot Viewer")
         self.setGeometry(200, 200, 800, 600)
-        self.setStyleSheet("background-color: #FFF; color: #000;")
         layout = QVBoxLayout(self)
+        # Imported here so QtWebEngine (Chromium) is only loaded once a plot is actually viewed
+        from PySide6.QtWebEngineWidgets import QWebEngineView
         self.web_view = QWebEngineView(self)
         layout.addWidget(self.web_view)
         self.load_plot(html_file_path)
@@ -20,5 +22,13 @@ class PlotViewerWidget(QWidget):
     def load_plot(self, html_file_path):
         """Loads the specified HTML file into the web view."""
         url = QUrl.fromLocalFile(html_file_path)
+        logging.debug("Loading plot from %s", url)
         self.web_view.load(url)
-        print(url)
+
+    def load_html(self, html: str, base_url=None):
+        """Loads an in-memory HTML document into the web view, without a disk round-trip.
+
+        QtWebEngine limits setHtml content to 2 MB, so plots embedding plotly.js should go through load_plot.
+        """
+        logging.debug("Loading plot from in-memory HTML (%d chars)", len(html))
+        self.web_view.setHtml(html, QUrl(base_url or ""))
@@ -1,3 +1,5 @@
+import logging
+
 from qfluentwidgets import MessageBoxBase, SubtitleLabel, ProgressBar
 
 
@@ -11,6 +13,7 @@ class ProgressDialog(MessageBoxBase):
         self.progressBar = ProgressBar(self)
         self.progressBar.setRange(0, 100)
         self.progressBar.setValue(0)
+        self._last_value = -1  # Last value pushed to the progress bar
 
         self.yesButton.setText("Close")
         self.yesButton.setVisible(False)
@@ -27,11 +30,14 @@ class ProgressDialog(MessageBoxBase):
         self.widget.setMinimumWidth(400)
         self.widget.setMinimumHeight(200)
         self.setMaximumSize(400, 200)
-        print(self.size())
-        print(self.widget.size())
+        logging.debug("ProgressDialog size: %s, widget size: %s", self.size(), self.widget.size())
 
     def update_progress(self, value):
-        """Updates the progress bar value."""
+        """Updates the progress bar value, skipping updates that would not change it."""
+        value = int(value)
+        if value == self._last_value:
+            return
+        self._last_value = value
         self.progressBar.setValue(value)
-        if value == 100:
+        if value >= 100:
             self.close()
@@ -4,6 +4,9 @@ from backend.config import MODELS, load_settings, save_settings
 from qfluentwidgets import ComboBox
 from qfluentwidgets import MessageBoxBase, SegmentedWidget, SubtitleLabel, Slider
 
+_MODEL_NAMES = tuple(MODELS.keys())
+_PROVIDERS = ("CPUExecutionProvider", "CUDAExecutionProvider")  # CUDA only works if available
+
 
 class SettingsDialog(MessageBoxBase):
     """Dialog for configuring application settings."""
@@ -19,15 +22,15 @@ class SettingsDialog(MessageBoxBase):
         self.themeSelector = SegmentedWidget(self)
         self.themeSelector.setFixedHeight(30)
         self.modelLabel = QLabel("Feature extractor model:", self)
-        self.modelLabel.setStyleSheet("font-size: 12pt")
+        self.modelLabel.setObjectName("SettingsLabel")
         self.modelComboBox = ComboBox(self)
         self.providerLabel = QLabel("ONNX execution provider:", self)
-        self.providerLabel.setStyleSheet("font-size: 12pt")
+        self.providerLabel.setObjectName("SettingsLabel")
         self.providerComboBox = ComboBox(self)
 
         # Thumbnail Quality Settings (with value label)
         self.thumbnailQualityLabel = QLabel("Thumbnail quality:", self)
-        self.thumbnailQualityLabel.setStyleSheet("font-size: 12pt")
+        self.thumbnailQualityLabel.setObjectName("SettingsLabel")
         self.thumbnailQualitySlider = Slider(Qt.Horizontal, self)
         self.thumbnailQualitySlider.setRange(1, 100)
         self.thumbnailQualityValueLabel = QLabel(str(self.settings["thumbnail_quality"]), self)
@@ -35,7 +38,7 @@ class SettingsDialog(MessageBoxBase):
 
         # Collage Images Settings (with value label)
         self.collageImagesLabel = QLabel("Images per collage:", self)
-        self.collageImagesLabel.setStyleSheet("font-size: 12pt")
+        self.collageImagesLabel.setObjectName("SettingsLabel")
         self.collageImagesSlider = Slider(Qt.Horizontal, self)
         self.collageImagesSlider.setRange(1, 25)
         self.collageImagesValueLabel = QLabel(str(self.settings["images_per_collage"]), self)
@@ -82,13 +85,11 @@ class SettingsDialog(MessageBoxBase):
         self.themeSelector.setCurrentItem(self.settings["theme"])  # Load saved theme
 
         # Add model options
-        for model_name in MODELS.keys():
-            self.modelComboBox.addItem(model_name)
+        self.modelComboBox.addItems(list(_MODEL_NAMES))
         self.modelComboBox.setCurrentText(self.settings["model"])  # Load saved model
 
         # Add provider options
-        self.providerComboBox.addItem("CPUExecutionProvider")
-        self.providerComboBox.addItem("CUDAExecutionProvider")  # Add if CUDA is available
+        self.providerComboBox.addItems(list(_PROVIDERS))
         self.providerComboBox.setCurrentText(self.settings["provider"])  # Load saved provider
 
         # Connect slider value changed signals to update labels
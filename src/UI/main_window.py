@@ -1,20 +1,53 @@
 # coding:utf-8
 import logging
+import os
 import sys
 
-from PySide6.QtCore import Qt, Signal, QEasingCurve
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Signal, QEasingCurve, QTimer, QDir, QThreadPool
+from PySide6.QtGui import QIcon, QPixmapCache
 from PySide6.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QApplication, QFrame, QWidget
-from UI.dialogs.export_dialog import ExportDialog
-from UI.dialogs.settings_dialog import SettingsDialog
-from backend.backend_initializer import BackendInitializer
-from backend.config import DARK_THEME_QSS_PATH, LIGHT_THEME_QSS_PATH, WINDOW_WIDTH, WINDOW_HEIGHT, APP_ICON_PATH
+from backend.config import (APP_QSS_PATH, RESOURCE_ROOT, DARK_THEME_QSS_PATH, LIGHT_THEME_QSS_PATH, WINDOW_WIDTH, WINDOW_HEIGHT,
+                            APP_ICON_PATH, PIXMAP_CACHE_LIMIT)
 from qfluentwidgets import FluentIcon as FIF, Flyout, InfoBarIcon, InfoBarPosition, InfoBar
 from qfluentwidgets import (NavigationBar, NavigationItemPosition, isDarkTheme, PopUpAniStackedWidget)
 from qframelesswindow import FramelessWindow, TitleBar
 
-from navigation_interface.sessions.sessions_widget import FolderListDialog
-from navigation_interface.workspace.workspace_widget import WorkspaceWidget
+# The workspace, backend and dialog modules pull in the ML stack (onnxruntime, scipy, ...),
+# so they are imported on first use rather than here; see Window._deferred_init.
+
+# Theme stylesheet contents keyed by path, stored with the file mtime they were read at
+_QSS_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def _read_qss(path) -> str:
+    """Returns the stylesheet at path, re-reading it only if the file changed."""
+    path = str(path)
+    mtime = os.path.getmtime(path)
+    cached = _QSS_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, encoding='utf-8') as f:
+        qss = f.read()
+    _QSS_CACHE[path] = (mtime, qss)
+    return qss
+
+
+def _install_app_style():
+    """Installs app.qss on the QApplication, after registering the "resource:" prefix its urls use."""
+    QDir.addSearchPath("resource", str(RESOURCE_ROOT))
+    QApplication.instance().setStyleSheet(_read_qss(APP_QSS_PATH))
+
+
+_APP_ICON: QIcon | None = None
+
+
+def _app_icon() -> QIcon:
+    """Returns the application icon, loading it from disk on first use."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(str(APP_ICON_PATH))
+    return _APP_ICON
 
 
 class Widget(QWidget):
@@ -66,6 +99,9 @@ class CustomTitleBar(TitleBar):
     def __init__(self, parent):
         super().__init__(parent)
         self.setFixedHeight(40)
+
+        # move the buttons into their own column with layout updates suspended
+        self.setUpdatesEnabled(False)
         self.hBoxLayout.removeWidget(self.minBtn)
         self.hBoxLayout.removeWidget(self.maxBtn)
         self.hBoxLayout.removeWidget(self.closeBtn)
@@ -73,6 +109,7 @@ class CustomTitleBar(TitleBar):
         # add window icon
         self.iconLabel = QLabel(self)
         self.iconLabel.setFixedSize(18, 18)
+        self._iconKey = None
         self.hBoxLayout.insertSpacing(0, 20)
         self.hBoxLayout.insertWidget(
             1, self.iconLabel, 0, Qt.AlignLeft | Qt.AlignVCenter)
@@ -82,6 +119,8 @@ class CustomTitleBar(TitleBar):
         self.titleLabel = QLabel(self)
         self.hBoxLayout.insertWidget(2, self.titleLabel, 0, Qt.AlignLeft | Qt.AlignVCenter)
         self.titleLabel.setObjectName('titleLabel')
+        self._lastTitle = None
+        self._titleAdjustPending = False
         self.window().windowTitleChanged.connect(self.setTitle)
 
         self.vBoxLayout = QVBoxLayout()
@@ -95,18 +134,40 @@ class CustomTitleBar(TitleBar):
         self.vBoxLayout.addLayout(self.buttonLayout)
         self.vBoxLayout.addStretch(1)
         self.hBoxLayout.addLayout(self.vBoxLayout, 0)
+        self.hBoxLayout.activate()
+        self.setUpdatesEnabled(True)
 
     def setTitle(self, title):
+        if title == self._lastTitle:
+            return
+        self._lastTitle = title
         self.titleLabel.setText(title)
+
+        # collapse title changes during startup into a single adjustSize
+        if not self._titleAdjustPending:
+            self._titleAdjustPending = True
+            QTimer.singleShot(0, self._adjustTitle)
+
+    def _adjustTitle(self):
+        self._titleAdjustPending = False
         self.titleLabel.adjustSize()
 
     def setIcon(self, icon):
-        self.iconLabel.setPixmap(QIcon(icon).pixmap(18, 18))
+        if not isinstance(icon, QIcon):
+            icon = QIcon(icon)
+
+        # windowIconChanged can repeat the same icon, only rasterize a new one
+        key = icon.cacheKey()
+        if key == self._iconKey:
+            return
+        self._iconKey = key
+        self.iconLabel.setPixmap(icon.pixmap(18, 18))
 
 
 class Window(FramelessWindow):
     def __init__(self):
         super().__init__()
+        _install_app_style()
         self.setTitleBar(CustomTitleBar(self))
 
         # use dark theme mode
@@ -119,8 +180,9 @@ class Window(FramelessWindow):
         self.navigationBar = NavigationBar(self)
         self.stackWidget = StackedWidget(self)
 
-        # create sub interface
-        self.mainInterface = WorkspaceWidget(self)
+        # sub interface and backend are created after the window is shown
+        self.mainInterface = None
+        self.backend = None
 
         # initialize layout
         self.initLayout()
@@ -128,12 +190,25 @@ class Window(FramelessWindow):
         # add items to navigation interface
         self.initNavigation()
 
-        # initialize backend
-        self.backend = BackendInitializer(workspace=self.mainInterface)
-
         # initialize window
         self.initWindow()
 
+        # build the heavy parts once the event loop is running so the shell paints first
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self):
+        """Imports and creates the workspace and backend."""
+        from backend.backend_initializer import BackendInitializer
+        from navigation_interface.workspace.workspace_widget import WorkspaceWidget
+
+        # create sub interface
+        self.mainInterface = WorkspaceWidget(self)
+        self.addSubInterface(self.mainInterface, FIF.TILES, 'Workspace', index=0)
+        self.navigationBar.setCurrentItem(self.mainInterface.objectName())
+
+        # initialize backend
+        self.backend = BackendInitializer(workspace=self.mainInterface)
+
     def initLayout(self):
         self.hBoxLayout.setSpacing(0)
         self.hBoxLayout.setContentsMargins(0, 48, 0, 0)
@@ -142,7 +217,7 @@ class Window(FramelessWindow):
         self.hBoxLayout.setStretchFactor(self.stackWidget, 1)
 
     def initNavigation(self):
-        self.addSubInterface(self.mainInterface, FIF.TILES, 'Workspace')
+        # the Workspace item is inserted at the top by _deferred_init
         # self.addSubInterface(self.sessionInterface, FIF.FOLDER, 'Sessions')
         self.navigationBar.addItem(
             routeKey="Sessions",
@@ -174,7 +249,6 @@ class Window(FramelessWindow):
         )
 
         self.stackWidget.currentChanged.connect(self.onCurrentInterfaceChanged)
-        self.navigationBar.setCurrentItem(self.mainInterface.objectName())
 
         # hide the text of button when selected
         # self.navigationBar.setSelectedTextVisible(False)
@@ -184,7 +258,7 @@ class Window(FramelessWindow):
 
     def initWindow(self):
         self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
-        self.setWindowIcon(QIcon(str(APP_ICON_PATH)))
+        self.setWindowIcon(_app_icon())
         self.setWindowTitle('BioSort')
         self.titleBar.setAttribute(Qt.WA_StyledBackground)
 
@@ -194,10 +268,12 @@ class Window(FramelessWindow):
 
         self.setQss()
 
-    def addSubInterface(self, interface, icon, text: str, position=NavigationItemPosition.TOP, selectedIcon=None):
+    def addSubInterface(self, interface, icon, text: str, position=NavigationItemPosition.TOP, selectedIcon=None,
+                        index=-1):
         """ add sub interface """
         self.stackWidget.addWidget(interface)
-        self.navigationBar.addItem(
+        self.navigationBar.insertItem(
+            index,
             routeKey=interface.objectName(),
             icon=icon,
             text=text,
@@ -208,8 +284,7 @@ class Window(FramelessWindow):
 
     def setQss(self):
         color = DARK_THEME_QSS_PATH if isDarkTheme() else LIGHT_THEME_QSS_PATH
-        with open(color, encoding='utf-8') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(_read_qss(color))
 
     def switchTo(self, widget):
         self.stackWidget.setCurrentWidget(widget)
@@ -220,29 +295,45 @@ class Window(FramelessWindow):
 
     def openSessionsDialog(self):
         """Open a dialog to select session folders."""
+        from backend.helpers.loading_threads import SessionListWorker, WorkerSignals
+        from navigation_interface.sessions.sessions_widget import FolderListDialog
 
-        # Replace get_all_sessions with list_sessions
-        existing_sessions = self.backend.session_manager.list_sessions()
-        sessions_data = tuple([(session.name, session.images_directory, session.id) for session in existing_sessions])
-
-        # Replace get_sessions_paths with list comprehension
-        initial_paths = [session.session_folder for session in existing_sessions]
+        if self.backend is None:
+            logging.error("Backend is not initialized yet.")
+            return
 
         title = 'Select Session'
         content = "Choose existing session or create a new one"
-        dialog = FolderListDialog(initial_paths, title, content, sessions_data, self)
+        dialog = FolderListDialog([], title, content, [], [], [], self)
         self.backend.init_sessions_presenter(dialog)
         dialog.folderChanged.connect(self.handleSessionsFolderSelected)
+
+        # List the sessions off the UI thread and fill the dialog once they arrive
+        dialog.setLoading(True)
+        self._session_list_signals = WorkerSignals()
+        self._session_list_signals.result.connect(lambda result: dialog.setSessions(*result))
+        self._session_list_signals.error.connect(lambda _: dialog.setLoading(False))
+        QThreadPool.globalInstance().start(
+            SessionListWorker(self.backend.session_manager, self._session_list_signals)
+        )
         dialog.exec()
+        self._session_list_signals.result.disconnect()
+        self._session_list_signals.error.disconnect()
 
     def openSettingsDialog(self):
+        from UI.dialogs.settings_dialog import SettingsDialog
+
+        if self.backend is None:
+            logging.error("Backend is not initialized yet.")
+            return
+
         dialog = SettingsDialog(self)
         dialog.accepted.connect(self.backend.apply_settings)
         dialog.exec()
 
     def performSave(self):
-        if not self.backend.session or not self.backend:
-            print("Error: No session selected.")
+        if self.backend is None or not self.backend.session:
+            logging.error("No session selected.")
             return
 
         try:
@@ -256,8 +347,8 @@ class Window(FramelessWindow):
                 parent=self,
                 isClosable=True
             )
-        except Exception as e:
-            print(f"Error during save: {e}")
+        except Exception:
+            logging.exception("Error during save")
             Flyout.create(
                 icon=InfoBarIcon.ERROR,
                 title='Session Save Failed',
@@ -269,17 +360,19 @@ class Window(FramelessWindow):
 
     def handleSessionsFolderSelected(self, folder_paths):
         """Process the selected folder paths."""
-        print(f"Selected folder paths: {folder_paths}")
+        logging.debug("Selected folder paths: %r", folder_paths)
 
     def openExportDialog(self):
         """Opens the export data dialog."""
-        if not self.backend.session or not self.backend:
-            print("Error: No session selected.")
+        if self.backend is None or not self.backend.session:
+            logging.error("No session selected.")
             return
 
+        from UI.dialogs.export_dialog import ExportDialog
+
         dialog = ExportDialog(self)
-        dialog.exec()
-        dialog.accepted.connect(self.export_session_data(dialog))
+        if dialog.exec():
+            self.export_session_data(dialog)
 
     def export_session_data(self, dialog):
         """Exports session data to the selected folder."""
@@ -291,7 +384,7 @@ class Window(FramelessWindow):
         include_charts = dialog.includeChartsCheckBox.isChecked()
 
         if export_folder_path == "No folder selected":
-            print("Error: No export folder selected.")
+            logging.error("No export folder selected.")
             return
 
         params = {
@@ -304,7 +397,7 @@ class Window(FramelessWindow):
 
         try:
             self.backend.data_manager.export_data(params)
-            print(f"Session data exported to: {export_folder_path}")
+            logging.debug("Session data exported to: %s", export_folder_path)
             Flyout.create(
                 icon=InfoBarIcon.SUCCESS,
                 title='Export Successful',
@@ -314,7 +407,7 @@ class Window(FramelessWindow):
                 isClosable=True
             )
         except Exception as e:
-            print(f"Error during export: {e}")
+            logging.exception("Error during export")
             InfoBar.error(
                 title='Export Error',
                 content=f"An error '{e}' occurred during export. Please try again with different settings or report the issue.",
@@ -327,7 +420,12 @@ class Window(FramelessWindow):
 
 
 if __name__ == '__main__':
+    if sys.platform == 'win32':
+        from backend.config import WEBENGINE_WINDOWS_CHROMIUM_FLAGS
+        os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", WEBENGINE_WINDOWS_CHROMIUM_FLAGS)
+
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
     w = Window()
 
     w.show()
@@ -1,8 +1,18 @@
+import logging
 import os
-
-from PySide6.QtCore import Qt, Signal
+from dataclasses import dataclass, field
+from typing import Optional
+
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QObject,
+    QAbstractListModel,
+    QModelIndex,
+    QRect,
+    QSize,
+)
 from PySide6.QtGui import (
-    QBrush,
     QColor,
     QFont,
     QFontMetrics,
@@ -10,23 +20,110 @@ from PySide6.QtGui import (
     QPainter,
     QPen,
     QPixmap,
+    QPixmapCache,
 )
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QHBoxLayout,
+    QListView,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
 )
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from UI.navigation_interface.sessions.create_session_dialog import CreateSessionDialog
 from qfluentwidgets import (
-    SingleDirectionScrollArea,
     FluentStyleSheet,
+    getStyleSheet,
+    themeColor,
+    IndeterminateProgressRing,
     isDarkTheme,
     getIconColor,
+    qconfig,
 )
 from qfluentwidgets.components.dialog_box.mask_dialog_base import MaskDialogBase
 
 
+class _ThemeState(QObject):
+    """Theme-dependent paint colors, recomputed only when the theme changes."""
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.iconColor = None
+        self._update()
+        qconfig.themeChanged.connect(self._update)
+
+    def _update(self, *_):
+        # drop the icons rendered for the previous theme
+        iconColor = getIconColor()
+        if self.iconColor is not None and iconColor != self.iconColor:
+            for name, size in _FOLDER_LIST_ICONS:
+                QPixmapCache.remove(_folderListIconKey(name, self.iconColor, size))
+        self.iconColor = iconColor
+
+        self.is_dark = isDarkTheme()
+        bg = 51 if self.is_dark else 204
+        self.normalColor = QColor(bg, bg, bg)
+        bg = 24 if self.is_dark else 230
+        self.hoverColor = QColor(bg, bg, bg)
+        self.pressedColor = QColor(153, 153, 153)
+        self.textColor = QColor(Qt.white if self.is_dark else Qt.black)
+
+
+# (name, size) of the folder list dialog icons kept in QPixmapCache
+_FOLDER_LIST_ICONS = (("Close", 12), ("Add", 22))
+
+
+def _folderListIconKey(name: str, color: str, size: int) -> str:
+    return f"folder_list_{name}_{color}_{size}"
+
+
+def _folderListIcon(name: str, size: int) -> QPixmap:
+    """Returns the scaled folder list dialog icon from the process-wide pixmap cache."""
+    c = _ThemeState.instance().iconColor
+    key = _folderListIconKey(name, c, size)
+    pix = QPixmap()
+    if not QPixmapCache.find(key, pix):
+        pix = QPixmap(
+            f":/qfluentwidgets/images/folder_list_dialog/{name}_{c}.png"
+        ).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pix)
+    return pix
+
+
+def _paintCardBackground(painter: QPainter, rect: QRect, isEnter, isPressed):
+    """Paints the card background for the given hover/pressed state."""
+    theme = _ThemeState.instance()
+    painter.setPen(Qt.NoPen)
+
+    # only the rounded rects need antialiasing, the hover frame is axis-aligned
+    if not isEnter:
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(theme.normalColor)
+        painter.drawRoundedRect(rect, 4, 4)
+    else:
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(QPen(theme.normalColor, 2))
+        painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        painter.setPen(Qt.NoPen)
+        if not isPressed:
+            painter.setBrush(theme.hoverColor)
+            painter.drawRect(rect.adjusted(2, 2, -2, -2))
+        else:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(theme.pressedColor)
+            painter.drawRoundedRect(rect.adjusted(5, 1, -5, -1), 2, 2)
+
+
 class ClickableWindow(QWidget):
     """Clickable window"""
 
@@ -60,133 +157,220 @@ class ClickableWindow(QWidget):
 
     def paintEvent(self, e):
         """paint window"""
+        if e.region().isEmpty():
+            return
+
         painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing)
+        _paintCardBackground(painter, self.rect(), self._isEnter, self._isPressed)
+
+
+@dataclass(eq=False)
+class FolderCard:
+    """
+    Represents a session in the folder list. Cards compare by identity, so two sessions with the same
+    name and folder stay distinct in the model, and the elided text cache never takes part in equality.
+
+    Attributes:
+        session_name (str): Display name of the session.
+        folder_path (str): Images directory of the session.
+        session_id (Optional[str]): Session identifier, set once the session is created.
+    """
+    session_name: str
+    folder_path: str
+    session_id: Optional[str] = None
+    # Elided (name, path) strings keyed by (name font size, path font size, width)
+    _elided_text_cache: dict = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def folderName(self):
+        return os.path.basename(self.folder_path)
 
-        isDark = isDarkTheme()
-        bg = 51 if isDark else 204
-        brush = QBrush(QColor(bg, bg, bg))
-        painter.setPen(Qt.NoPen)
+    def get_folder_path(self):
+        return self.folder_path
 
-        if not self._isEnter:
-            painter.setBrush(brush)
-            painter.drawRoundedRect(self.rect(), 4, 4)
-        else:
-            painter.setPen(QPen(QColor(bg, bg, bg), 2))
-            painter.drawRect(1, 1, self.width() - 2, self.height() - 2)
-            painter.setPen(Qt.NoPen)
-            if not self._isPressed:
-                bg = 24 if isDark else 230
-                brush.setColor(QColor(bg, bg, bg))
-                painter.setBrush(brush)
-                painter.drawRect(2, 2, self.width() - 4, self.height() - 4)
-            else:
-                bg = 102 if isDark else 230
-                brush.setColor(QColor(153, 153, 153))
-                painter.setBrush(brush)
-                painter.drawRoundedRect(
-                    5, 1, self.width() - 10, self.height() - 2, 2, 2
-                )
+    def get_session_name(self):
+        return self.session_name
 
+    def get_session_id(self):
+        return self.session_id
 
-class FolderCard(ClickableWindow):
-    """Folder card"""
+    def set_session_id(self, session_id):
+        self.session_id = session_id
 
-    folder_tile_clicked = Signal(str)
 
-    def __init__(self, session_name: str, folderPath: str, session_id: str = None, parent=None):
-        super().__init__(parent)
-        self.folder_path = folderPath
-        self.session_name = session_name
-        self.session_id = session_id
-        self.folderName = os.path.basename(folderPath)
-        self.clicked.connect(self.on_folder_tile_clicked)
-        c = getIconColor()
-        self.__closeIcon = QPixmap(
-            f":/qfluentwidgets/images/folder_list_dialog/Close_{c}.png"
-        ).scaled(12, 12, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+class FolderListModel(QAbstractListModel):
+    """List model holding the folder cards of the sessions dialog."""
 
-    def paintEvent(self, e):
-        """paint card"""
-        super().paintEvent(e)
-        painter = QPainter(self)
-        painter.setRenderHints(
-            QPainter.TextAntialiasing
-            | QPainter.SmoothPixmapTransform
-            | QPainter.Antialiasing
-        )
+    def __init__(self, cards=None, parent=None):
+        super().__init__(parent)
+        self._cards = cards or []
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._cards)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._cards)):
+            return None
+
+        card = self._cards[index.row()]
+        if role == Qt.DisplayRole:
+            return card.session_name
+        elif role == Qt.ToolTipRole:
+            return card.folder_path
+        elif role == Qt.UserRole:
+            return card
+        return None
+
+    def addCard(self, card: FolderCard):
+        row = len(self._cards)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._cards.append(card)
+        self.endInsertRows()
+
+    def removeCard(self, card: FolderCard):
+        """Removes the card and returns its former row."""
+        row = self._cards.index(card)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._cards.pop(row)
+        self.endRemoveRows()
+        return row
+
+    def cards(self):
+        return self._cards
+
+    def setCards(self, cards):
+        self.beginResetModel()
+        self._cards = cards
+        self.endResetModel()
+
+
+class FolderCardDelegate(QStyledItemDelegate):
+    """Paints the folder cards of the sessions list directly into the view."""
+
+    CARD_HEIGHT = 72
+    SPACING = 8
+
+    # Text fonts and their metrics, keyed by (pixel size, bold)
+    _fontCache: dict[tuple[int, bool], tuple[QFont, QFontMetrics]] = {}
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+
+    @classmethod
+    def _font(cls, pixelSize, bold=False):
+        """Returns the shared (font, metrics) pair for the given size and weight."""
+        key = (pixelSize, bold)
+        cached = cls._fontCache.get(key)
+        if cached is None:
+            font = QFont("Microsoft YaHei")
+            font.setBold(bold)
+            font.setPixelSize(pixelSize)
+            cached = cls._fontCache[key] = (font, QFontMetrics(font))
+        return cached
+
+    def paint(self, painter, option, index):
+        card = index.data(Qt.UserRole)
+        if card is None:
+            return
+
+        rect = QRect(option.rect.x(), option.rect.y(), option.rect.width(), self.CARD_HEIGHT)
+        view = self.parent()
+        isEnter = bool(option.state & QStyle.State_MouseOver)
+        isPressed = isEnter and view.pressedRow() == index.row()
+
+        painter.save()
+        painter.setRenderHints(QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform)
+        _paintCardBackground(painter, rect, isEnter, isPressed)
 
         # paint text and icon
-        color = Qt.white if isDarkTheme() else Qt.black
-        painter.setPen(color)
-        if self._isPressed:
-            self.__drawText(painter, 12, 12, 12, 10)
-            painter.drawPixmap(self.width() - 26, 18, self.__closeIcon)
+        painter.setPen(_ThemeState.instance().textColor)
+        x, y, w = rect.x(), rect.y(), rect.width()
+        closeIcon = _folderListIcon("Close", 12)
+        if isPressed:
+            self.__drawText(painter, card, rect, 12, 12, 12, 10)
+            painter.drawPixmap(x + w - 26, y + 18, closeIcon)
         else:
-            self.__drawText(painter, 10, 13, 10, 11)
-            painter.drawPixmap(self.width() - 24, 20, self.__closeIcon)
-
-    def on_folder_tile_clicked(self):
-        self.folder_tile_clicked.emit(self.session_id)
+            self.__drawText(painter, card, rect, 10, 13, 10, 11)
+            painter.drawPixmap(x + w - 24, y + 20, closeIcon)
+        painter.restore()
 
-    def __drawText(self, painter, x1, fontSize1, x2, fontSize2):
+    def __drawText(self, painter, card, rect, x1, fontSize1, x2, fontSize2):
         """draw text"""
+        nameFont, nameMetrics = self._font(fontSize1, True)
+        pathFont, pathMetrics = self._font(fontSize2)
+        x, y, w = rect.x(), rect.y(), rect.width()
+
+        key = (fontSize1, fontSize2, w)
+        elided = card._elided_text_cache.get(key)
+        if elided is None:
+            elided = card._elided_text_cache[key] = (
+                nameMetrics.elidedText(card.session_name, Qt.ElideRight, w - 48),
+                pathMetrics.elidedText(card.folder_path, Qt.ElideRight, w - 24),
+            )
+        name, path = elided
+
         # paint folder name
-        font = QFont("Microsoft YaHei")
-        font.setBold(True)
-        font.setPixelSize(fontSize1)
-        painter.setFont(font)
-        name = QFontMetrics(font).elidedText(
-            self.session_name, Qt.ElideRight, self.width() - 48
-        )
-        painter.drawText(x1, 30, name)
+        painter.setFont(nameFont)
+        painter.drawText(x + x1, y + 30, name)
 
         # paint folder path
-        font = QFont("Microsoft YaHei")
-        font.setPixelSize(fontSize2)
-        painter.setFont(font)
-        path = QFontMetrics(font).elidedText(
-            self.folder_path, Qt.ElideRight, self.width() - 24
-        )
-        painter.drawText(x2, 37, self.width() - 16, 18, Qt.AlignLeft, path)
+        painter.setFont(pathFont)
+        painter.drawText(x + x2, y + 37, w - 16, 18, Qt.AlignLeft, path)
 
-    def get_folder_path(self):
-        return self.folder_path
 
-    def get_session_name(self):
-        return self.session_name
+class FolderListView(QListView):
+    """List view of the folder cards, only the visible rows are painted."""
 
-    def set_session_id(self, session_id):
-        self.session_id = session_id
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pressedRow = -1
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setItemDelegate(FolderCardDelegate(self))
+
+    def pressedRow(self):
+        return self._pressedRow
+
+    def mousePressEvent(self, e: QMouseEvent):
+        self._pressedRow = self.indexAt(e.position().toPoint()).row()
+        self.viewport().update()
+        super().mousePressEvent(e)
+
+    def mouseReleaseEvent(self, e: QMouseEvent):
+        self._pressedRow = -1
+        self.viewport().update()
+        super().mouseReleaseEvent(e)
 
 
 class AddFolderCard(ClickableWindow):
     """Add folder card"""
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        c = getIconColor()
-        self.__iconPix = QPixmap(
-            f":/qfluentwidgets/images/folder_list_dialog/Add_{c}.png"
-        ).scaled(22, 22, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
     def paintEvent(self, e):
         """paint card"""
+        if e.region().isEmpty():
+            return
+
         super().paintEvent(e)
         painter = QPainter(self)
+        iconPix = _folderListIcon("Add", 22)
         w = self.width()
         h = self.height()
-        pw = self.__iconPix.width()
-        ph = self.__iconPix.height()
+        pw = iconPix.width()
+        ph = iconPix.height()
         if not self._isPressed:
-            painter.drawPixmap(int(w / 2 - pw / 2), int(h / 2 - ph / 2), self.__iconPix)
+            painter.drawPixmap(int(w / 2 - pw / 2), int(h / 2 - ph / 2), iconPix)
         else:
             painter.drawPixmap(
                 int(w / 2 - (pw - 4) / 2),
                 int(h / 2 - (ph - 4) / 2),
                 pw - 4,
                 ph - 4,
-                self.__iconPix,
+                iconPix,
                 )
 
 
@@ -197,29 +381,38 @@ class FolderListDialog(MaskDialogBase):
     session_created = Signal(FolderCard)
     session_chosen = Signal(str)
 
-    def __init__(self, folderPaths: list, title: str, content: str, sessions_data: tuple, parent):
+    # Theme-resolved dialog stylesheet, keyed by (dark theme, theme color)
+    _qssCache: dict[tuple[bool, str], str] = {}
+
+    def __init__(self, folderPaths: list, title: str, content: str,
+                 names: list[str], paths: list[str], ids: list[str], parent):
         super().__init__(parent=parent)
         self.title = title
         self.content = content
 
-        self.__originalPaths = folderPaths
+        self.__originalPaths = frozenset(folderPaths)
         self.folder_paths = folderPaths.copy()
+        self._session_name_set = set(names)
 
         self.vBoxLayout = QVBoxLayout(self.widget)
         self.titleLabel = QLabel(title, self.widget)
         self.contentLabel = QLabel(content, self.widget)
-        self.scrollArea = SingleDirectionScrollArea(self.widget)
-        self.scrollWidget = QWidget(self.scrollArea)
+        self.scrollWidget = QWidget(self.widget)
         self.completeButton = QPushButton(self.tr("Done"), self.widget)
         self.addFolderCard = AddFolderCard(self.scrollWidget)
-
-        # Create folder cards
-        self.folder_cards = [FolderCard(session_name, images_directory, session_id, self.scrollWidget)
-                             for (session_name, images_directory, session_id) in sessions_data]
+        self.loadingRing = IndeterminateProgressRing(self.scrollWidget)
+        self.loadingRing.setFixedSize(36, 36)
+        self.loadingRing.hide()
+
+        # Folder cards are plain records, the list view paints only the visible rows
+        self.folder_model = FolderListModel(list(map(FolderCard, names, paths, ids)), self)
+        self.folderListView = FolderListView(self.scrollWidget)
+        self.folderListView.setModel(self.folder_model)
         self.__initWidget()
 
     def __initWidget(self):
         """initialize widgets"""
+        self.widget.setUpdatesEnabled(False)
         self.__setQss()
 
         w = max(
@@ -228,27 +421,46 @@ class FolderListDialog(MaskDialogBase):
             352,
             )
         self.widget.setFixedWidth(w)
-        self.scrollArea.resize(294, 72)
-        self.scrollWidget.resize(292, 72)
-        self.scrollArea.setFixedWidth(294)
-        self.scrollWidget.setFixedWidth(292)
-        self.scrollArea.setMaximumHeight(400)
-        self.scrollArea.setViewportMargins(0, 0, 0, 0)
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setWidget(self.scrollWidget)
-        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scrollArea.hScrollBar.setForceHidden(True)
+        self.scrollWidget.setFixedWidth(294)
+        self.folderListView.setFixedWidth(294)
         self.__initLayout()
+        self.widget.setUpdatesEnabled(True)
+        self.widget.update()
 
         # connect signal to slot
         self.addFolderCard.clicked.connect(self.openCreateSessionDialog)
         self.completeButton.clicked.connect(self.__onButtonClicked)
-        for card in self.folder_cards:
-            card.folder_tile_clicked.connect(self.on_folder_card_clicked)
+        self.folderListView.clicked.connect(self.on_folder_index_clicked)
+
+    @property
+    def folder_cards(self):
+        return self.folder_model.cards()
+
+    def setLoading(self, isLoading: bool):
+        """Shows the progress ring in place of the folder list while sessions are listed."""
+        self.loadingRing.setVisible(isLoading)
+        self.addFolderCard.setEnabled(not isLoading)
+        if isLoading:
+            self.folderListView.hide()
+        else:
+            self.__adjustWidgetSize()
+
+    def setSessions(self, names: list[str], paths: list[str], ids: list[str], folderPaths: list):
+        """Populates the folder list once the sessions have been listed."""
+        self.__originalPaths = frozenset(folderPaths)
+        self.folder_paths = folderPaths.copy()
+        self._session_name_set = set(names)
+        self.folder_model.setCards(list(map(FolderCard, names, paths, ids)))
+        self.setLoading(False)
+
+    def on_folder_index_clicked(self, index: QModelIndex):
+        card = index.data(Qt.UserRole)
+        if card is not None:
+            self.on_folder_card_clicked(card.session_id)
 
     def on_folder_card_clicked(self, session_id):
         """Handle the selection of a folder card."""
-        print(f"Selected Session with ID: ({session_id})")
+        logging.debug("Selected Session with ID: (%s)", session_id)
         self.session_chosen.emit(session_id)
         self.close()  # Close the dialog
 
@@ -263,23 +475,19 @@ class FolderListDialog(MaskDialogBase):
         session_name = dialog.sessionNameLineEdit.text().strip()
         folder_path = dialog.selectedFolderPath
         if session_name and folder_path:
-            session_names = [card.get_session_name() for card in self.folder_cards]
-            if session_name in session_names:
+            if session_name in self._session_name_set:
                 return
 
-            card = FolderCard(session_name, folder_path, None, self.scrollWidget)
-            self.scrollLayout.addWidget(card, 0, Qt.AlignTop)
-            card.folder_tile_clicked.connect(self.on_folder_card_clicked)
-            card.show()
-
+            card = FolderCard(session_name, folder_path)
+            self.folder_model.addCard(card)
             self.folder_paths.append(folder_path)
-            self.folder_cards.append(card)
+            self._session_name_set.add(session_name)
 
             self.__adjustWidgetSize()
 
             self.session_created.emit(card)
         else:
-            print("Error creating session.")
+            logging.error("Error creating session.")
 
     def __initLayout(self):
         """initialize layout"""
@@ -301,17 +509,17 @@ class FolderListDialog(MaskDialogBase):
         layout_2 = QHBoxLayout()
         layout_2.setAlignment(Qt.AlignCenter)
         layout_2.setContentsMargins(4, 0, 4, 0)
-        layout_2.addWidget(self.scrollArea, 0, Qt.AlignCenter)
+        layout_2.addWidget(self.scrollWidget, 0, Qt.AlignCenter)
         self.vBoxLayout.addLayout(layout_2, 1)
-        self.vBoxLayout.addSpacing(24)
+        self.vBoxLayout.addSpacing(16)
 
         self.scrollLayout = QVBoxLayout(self.scrollWidget)
         self.scrollLayout.setAlignment(Qt.AlignTop)
         self.scrollLayout.setContentsMargins(0, 0, 0, 0)
         self.scrollLayout.setSpacing(8)
         self.scrollLayout.addWidget(self.addFolderCard, 0, Qt.AlignTop)
-        for card in self.folder_cards:
-            self.scrollLayout.addWidget(card, 0, Qt.AlignTop)
+        self.scrollLayout.addWidget(self.loadingRing, 0, Qt.AlignHCenter | Qt.AlignTop)
+        self.scrollLayout.addWidget(self.folderListView, 0, Qt.AlignTop)
 
         # buttons
         layout_3 = QHBoxLayout()
@@ -324,11 +532,9 @@ class FolderListDialog(MaskDialogBase):
 
     def deleteFolderCard(self, folderCard):
         """delete selected folder card"""
-        self.scrollLayout.removeWidget(folderCard)
-        index = self.folder_cards.index(folderCard)
-        self.folder_cards.pop(index)
+        index = self.folder_model.removeCard(folderCard)
         self.folder_paths.pop(index)
-        folderCard.deleteLater()
+        self._session_name_set.discard(folderCard.get_session_name())
 
         # adjust height
         self.__adjustWidgetSize()
@@ -342,9 +548,14 @@ class FolderListDialog(MaskDialogBase):
         self.contentLabel.setObjectName("contentLabel")
         self.completeButton.setObjectName("completeButton")
         self.scrollWidget.setObjectName("scrollWidget")
+        self.folderListView.setObjectName("folderListView")
 
-        FluentStyleSheet.FOLDER_LIST_DIALOG.apply(self)
-        self.setStyle(QApplication.style())
+        # setStyleSheet already polishes the widget tree, so no setStyle() re-polish is needed
+        key = (isDarkTheme(), themeColor().name())
+        qss = FolderListDialog._qssCache.get(key)
+        if qss is None:
+            qss = FolderListDialog._qssCache[key] = getStyleSheet(FluentStyleSheet.FOLDER_LIST_DIALOG)
+        self.setStyleSheet(qss)
 
         self.titleLabel.adjustSize()
         self.contentLabel.adjustSize()
@@ -352,7 +563,7 @@ class FolderListDialog(MaskDialogBase):
 
     def __onButtonClicked(self):
         """done button clicked slot"""
-        if sorted(self.__originalPaths) != sorted(self.folder_paths):
+        if frozenset(self.folder_paths) != self.__originalPaths:
             self.setEnabled(False)
             QApplication.processEvents()
             self.folderChanged.emit(self.folder_paths)
@@ -360,7 +571,8 @@ class FolderListDialog(MaskDialogBase):
 
     def __adjustWidgetSize(self):
         N = len(self.folder_cards)
-        h = 72 * (N + 1) + 8 * N
-        self.scrollArea.setFixedHeight(min(h, 400))
+        rowHeight = FolderCardDelegate.CARD_HEIGHT + FolderCardDelegate.SPACING
+        self.folderListView.setVisible(N > 0)
+        self.folderListView.setFixedHeight(min(rowHeight * N, 400 - rowHeight))
 
 
@@ -1,28 +1,103 @@
+import logging
 from pathlib import Path
 
-from PySide6.QtCore import Signal, QUrl
-from PySide6.QtGui import QColor, QPainterPath, QPainter, QPen
-from PySide6.QtWidgets import QVBoxLayout, QSizePolicy
-from backend.config import ANALYSIS_CARD_WIDTH, ANALYSIS_CARD_HEIGHT
+import numpy as np
+from PySide6.QtCharts import QAreaSeries, QChart, QLineSeries, QScatterSeries
+from PySide6.QtCore import Qt, Signal, QPointF, QRectF, QUrl
+from PySide6.QtGui import QColor, QImage, QPainterPath, QPainter, QPen, QPixmap
+from PySide6.QtWebEngineCore import QWebEngineProfile
+from PySide6.QtWidgets import QGraphicsScene, QLabel, QVBoxLayout, QSizePolicy, QWidget
+from backend.config import (ANALYSIS_CARD_WIDTH, ANALYSIS_CARD_HEIGHT, ANALYSIS_WEBVIEW_POOL_SIZE,
+                            WEBENGINE_CACHE_DIR, WEBENGINE_HTTP_CACHE_SIZE)
 from qfluentwidgets import CardWidget, isDarkTheme
 from qframelesswindow.webengine import FramelessWebEngineView
 
 
+def configure_web_profile():
+    """Gives the default web profile, shared by all plot views, a persistent HTTP disk cache."""
+    profile = QWebEngineProfile.defaultProfile()
+    profile.setCachePath(WEBENGINE_CACHE_DIR)
+    profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+    profile.setHttpCacheMaximumSize(WEBENGINE_HTTP_CACHE_SIZE)
+
+
+class WebViewPool:
+    """ Keeps idle web views around so new analysis cards don't each start a fresh Chromium view. """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, size=ANALYSIS_WEBVIEW_POOL_SIZE):
+        self.size = size
+        self._idle = []
+        # hidden parent for the idle views
+        self._holder = QWidget()
+        self._holder.hide()
+
+    def preload(self):
+        """Creates idle views until the pool is full."""
+        while len(self._idle) < self.size:
+            self._idle.append(FramelessWebEngineView(self._holder))
+
+    def acquire(self, parent):
+        view = self._idle.pop() if self._idle else FramelessWebEngineView(self._holder)
+        view.setParent(parent)
+        return view
+
+    def release(self, view):
+        """Takes a view back from a card that is being deleted."""
+        view.loadFinished.disconnect()
+        view.setParent(self._holder)
+        if len(self._idle) < self.size:
+            view.setUrl(QUrl("about:blank"))
+            self._idle.append(view)
+        else:
+            view.deleteLater()
+
+
 class AnalysisCard(CardWidget):
     """ Card for displaying analysis plots. """
     deleteRequested = Signal()
     doubleClicked = Signal(str)
 
+    # Border colors, shared by all cards
+    _defaultBorderColor = QColor(240, 240, 240, 60)
+    _darkPressedBorderColor = QColor(255, 255, 255, 18)
+    _darkHoverBorderColor = QColor(255, 255, 255, 13)
+    _lightHoverBottomBorderColor = QColor(0, 0, 0, 27)
+
+    # the plot is loaded into the web view only while the card is near the viewport
+    _loadsLazily = True
+
     def __init__(self, html_file_path, parent=None):
         super().__init__(parent)
         self._borderRadius = 0
         self.html_file_path = html_file_path
         # self.label = CaptionLabel(Path(html_file_path).stem, self)  # Set label name from the file name
-        self.web_view = FramelessWebEngineView(self)
 
         self.vBoxLayout = QVBoxLayout(self)
         self.vBoxLayout.setContentsMargins(0, 0, 0, 0)  # Remove card margins
 
+        self.card_height = ANALYSIS_CARD_HEIGHT
+        self.card_width = ANALYSIS_CARD_WIDTH
+
+        # pen of the background border, only its color changes between paints
+        self._borderPen = QPen()
+        self._borderPen.setWidth(3)
+
+        self.setFixedSize(self.card_width, self.card_height)
+        self._rebuildPaths()
+        self._initContent()
+
+    def _initContent(self):
+        """Embeds the plot HTML in a web view."""
+        self.web_view = WebViewPool.instance().acquire(self)
+
         # Ensure web_view takes available space and caption label uses minimum space
         self.web_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # For webview
         # self.label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
@@ -30,22 +105,37 @@ class AnalysisCard(CardWidget):
         self.vBoxLayout.addWidget(self.web_view)  # stretch factor for webview
         # self.vBoxLayout.addWidget(self.label, 0, Qt.AlignHCenter | Qt.AlignBottom)
 
-        self.card_height = ANALYSIS_CARD_HEIGHT
-        self.card_width = ANALYSIS_CARD_WIDTH
-
-        self.setFixedSize(self.card_width, self.card_height)
-
         # Connect loadFinished signal for debugging
         self.web_view.loadFinished.connect(self.on_load_finished)
 
-        # Load the plot
-        self.load_plot(html_file_path)
+        # The plot is loaded once the card is scrolled into view, see setPlotVisible
+        self._plotLoaded = False
+
+    def setPlotVisible(self, visible):
+        """Loads the plot when the card enters the view and unloads it once it is far offscreen."""
+        if visible and not self._plotLoaded:
+            self._plotLoaded = True
+            self.load_plot(self.html_file_path)
+        elif not visible and self._plotLoaded:
+            self._plotLoaded = False
+            self.web_view.setUrl(QUrl("about:blank"))
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self._loadsLazily and not self.visibleRegion().isEmpty():
+            self.setPlotVisible(True)
+
+    def releaseContent(self):
+        """Hands the web view back to the pool before the card is deleted."""
+        WebViewPool.instance().release(self.web_view)
 
     def on_load_finished(self, success):
         if not success:
-            print("Failed to load the plot HTML.")
+            logging.error("Failed to load the plot HTML.")
         else:
-            print("Plot HTML loaded successfully.")
+            logging.debug("Plot HTML loaded successfully.")
+        # queue a repaint of the border, Qt merges it with any pending ones
+        self.update()
 
     def _normalBackgroundColor(self):
         return QColor(255, 255, 255, 13 if isDarkTheme() else 170)
@@ -53,59 +143,89 @@ class AnalysisCard(CardWidget):
     def _hoverBackgroundColor(self):
         return QColor(237, 255, 245, 90 if isDarkTheme() else 64)
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing)
-
+    def _rebuildPaths(self):
+        """Builds the border paths for the current size, the card only repaints them.
+        Straight segments and corner arcs are kept apart so only the arcs are antialiased."""
         w, h = self.width(), self.height()
         r = self.borderRadius
         d = 2 * r
 
-        isDark = isDarkTheme()
+        # top border
+        arcs, lines = QPainterPath(), QPainterPath()
+        arcs.arcMoveTo(1, h - d - 1, d, d, 240)
+        arcs.arcTo(1, h - d - 1, d, d, 225, -60)
+        lines.moveTo(arcs.currentPosition())
+        lines.lineTo(1, r)
+        arcs.arcMoveTo(1, 1, d, d, 180)
+        arcs.arcTo(1, 1, d, d, -180, -90)
+        lines.moveTo(arcs.currentPosition())
+        lines.lineTo(w - r, 1)
+        arcs.arcMoveTo(w - d - 1, 1, d, d, 90)
+        arcs.arcTo(w - d - 1, 1, d, d, 90, -90)
+        lines.moveTo(arcs.currentPosition())
+        lines.lineTo(w - 1, h - r)
+        arcs.arcMoveTo(w - d - 1, h - d - 1, d, d, 0)
+        arcs.arcTo(w - d - 1, h - d - 1, d, d, 0, -60)
+        self._topArcs, self._topLines = arcs, lines
+
+        # bottom border
+        arcs, lines = QPainterPath(), QPainterPath()
+        arcs.arcMoveTo(1, h - d - 1, d, d, 240)
+        arcs.arcTo(1, h - d - 1, d, d, 240, 30)
+        lines.moveTo(arcs.currentPosition())
+        lines.lineTo(w - r - 1, h - 1)
+        arcs.arcMoveTo(w - d - 1, h - d - 1, d, d, 270)
+        arcs.arcTo(w - d - 1, h - d - 1, d, d, 270, 30)
+        self._bottomArcs, self._bottomLines = arcs, lines
 
-        # draw top border
-        path = QPainterPath()
+        # the card paints its background under its translucent children, so the whole card is the border area
+        self._borderRect = self.rect()
+        self._bgRect = self._borderRect.adjusted(1, 1, -1, -1)
 
-        path.arcMoveTo(1, h - d - 1, d, d, 240)
-        path.arcTo(1, h - d - 1, d, d, 225, -60)
-        path.lineTo(1, r)
-        path.arcTo(1, 1, d, d, -180, -90)
-        path.lineTo(w - r, 1)
-        path.arcTo(w - d - 1, 1, d, d, 90, -90)
-        path.lineTo(w - 1, h - r)
-        path.arcTo(w - d - 1, h - d - 1, d, d, 0, -60)
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._rebuildPaths()
+
+    def paintEvent(self, e):
+        if not e.region().intersects(self._borderRect):
+            return
+
+        painter = QPainter(self)
+        r = self.borderRadius
+        isDark = isDarkTheme()
 
-        topBorderColor = QColor(240, 240, 240, 60)
+        # border colors for the current state
+        topBorderColor = self._defaultBorderColor
         if isDark:
             if self.isPressed:
-                topBorderColor = QColor(255, 255, 255, 18)
+                topBorderColor = self._darkPressedBorderColor
             elif self.isHover:
-                topBorderColor = QColor(255, 255, 255, 13)
-        else:
-            topBorderColor = QColor(240, 240, 240, 60)
-
-        painter.strokePath(path, topBorderColor)
-
-        # draw bottom border
-        path = QPainterPath()
-        path.arcMoveTo(1, h - d - 1, d, d, 240)
-        path.arcTo(1, h - d - 1, d, d, 240, 30)
-        path.lineTo(w - r - 1, h - 1)
-        path.arcTo(w - d - 1, h - d - 1, d, d, 270, 30)
+                topBorderColor = self._darkHoverBorderColor
 
         bottomBorderColor = topBorderColor
         if not isDark and self.isHover and not self.isPressed:
-            bottomBorderColor = QColor(0, 0, 0, 27)
+            bottomBorderColor = self._lightHoverBottomBorderColor
 
-        painter.strokePath(path, bottomBorderColor)
+        self._drawStraight(painter, topBorderColor, bottomBorderColor)
+        if r > 0:
+            self._drawArcs(painter, topBorderColor, bottomBorderColor)
 
-        # draw background and border
-        pen = QPen(topBorderColor)
-        pen.setWidth(3)
-        painter.setPen(pen)
-        rect = self.rect().adjusted(1, 1, -1, -1)
+        # draw background and border, square corners are axis-aligned and need no antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, r > 0)
+        self._borderPen.setColor(topBorderColor)
+        painter.setPen(self._borderPen)
         painter.setBrush(self.backgroundColor)
-        painter.drawRoundedRect(rect, r, r)
+        painter.drawRoundedRect(self._bgRect, r, r)
+
+    def _drawStraight(self, painter, topBorderColor, bottomBorderColor):
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.strokePath(self._topLines, topBorderColor)
+        painter.strokePath(self._bottomLines, bottomBorderColor)
+
+    def _drawArcs(self, painter, topBorderColor, bottomBorderColor):
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.strokePath(self._topArcs, topBorderColor)
+        painter.strokePath(self._bottomArcs, bottomBorderColor)
 
     def mouseReleaseEvent(self, e):  # Emit clicked signal on mouse release
         super().mouseReleaseEvent(e)
@@ -121,3 +241,156 @@ class AnalysisCard(CardWidget):
 
     def mouseDoubleClickEvent(self, event):
         self.doubleClicked.emit(self.html_file_path)  # Emit the file path
+
+
+class ImageAnalysisCard(AnalysisCard):
+    """ Card showing a static PNG render of the Plotly plot, the HTML is only loaded by the plot viewer. """
+
+    _loadsLazily = False
+
+    def __init__(self, png_file_path, html_file_path, parent=None):
+        self.png_file_path = png_file_path
+        super().__init__(html_file_path, parent)
+
+    def _initContent(self):
+        self.label = QLabel(self)
+        self.label.setAlignment(Qt.AlignCenter)
+        self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        pixmap = QPixmap(self.png_file_path)
+        if pixmap.isNull():
+            logging.error(f"Failed to load the plot image: {self.png_file_path}")
+        else:
+            ratio = self.devicePixelRatioF()
+            pixmap = pixmap.scaled(self.size() * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(ratio)
+            self.label.setPixmap(pixmap)
+        self.vBoxLayout.addWidget(self.label)
+
+    def setPlotVisible(self, visible):
+        pass
+
+    def releaseContent(self):
+        pass
+
+
+# Default Plotly qualitative colors, so native cards match the HTML plots
+_PLOT_COLORS = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A',
+                '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
+
+
+class NativeAnalysisCard(AnalysisCard):
+    """ Card drawing the plot series with Qt Charts instead of an embedded browser.
+    The chart is rendered once into an image buffer, the card paints that image. """
+
+    _loadsLazily = False
+
+    def __init__(self, plot_data, html_factory, parent=None):
+        self.plot_data = plot_data
+        # returns the Plotly HTML for the plot viewer, asked again on every double click
+        self.html_factory = html_factory
+        super().__init__(None, parent)
+
+    def _initContent(self):
+        chart = QChart()
+        chart.setTheme(QChart.ChartThemeDark if isDarkTheme() else QChart.ChartThemeLight)
+        chart.setBackgroundVisible(False)
+        chart.setTitle(self.plot_data["title"])
+
+        if self.plot_data["type"] == "histogram":
+            self._addHistogramSeries(chart)
+        else:
+            self._addScatterSeries(chart)
+
+        chart.createDefaultAxes()
+        horizontal, vertical = chart.axes(Qt.Horizontal), chart.axes(Qt.Vertical)
+        if horizontal:
+            horizontal[0].setTitleText(self.plot_data["x_label"])
+        if vertical:
+            vertical[0].setTitleText(self.plot_data["y_label"])
+        chart.legend().setVisible(len(self.plot_data["series"]) > 1)
+
+        self._renderChart(chart)
+
+    def _renderChart(self, chart):
+        """Renders the chart into a numpy buffer wrapped by a QImage, without copying the pixels."""
+        ratio = self.devicePixelRatioF()
+        width, height = round(self.width() * ratio), round(self.height() * ratio)
+        # the image only views the array, so the card keeps the array alive as long as the image
+        self._buffer = np.zeros((height, width, 4), dtype=np.uint8)
+        self._image = QImage(self._buffer.data, width, height, 4 * width, QImage.Format_RGBA8888_Premultiplied)
+        self._image.setDevicePixelRatio(ratio)
+
+        # the chart and its series are only needed for this render and go away with the scene
+        scene = QGraphicsScene()
+        scene.addItem(chart)
+        target = QRectF(0, 0, self.width(), self.height())
+        chart.setGeometry(target)
+        painter = QPainter(self._image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        scene.render(painter, target, target)
+        painter.end()
+
+    def paintEvent(self, e):
+        super().paintEvent(e)
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._image)
+
+    def _addHistogramSeries(self, chart):
+        edges = self.plot_data["edges"]
+        layered = len(self.plot_data["series"]) > 1
+        top = 0.0
+        for i, (name, counts) in enumerate(self.plot_data["series"]):
+            upper = QLineSeries()
+            for left, right, count in zip(edges[:-1], edges[1:], counts):
+                upper.append(float(left), float(count))
+                upper.append(float(right), float(count))
+            top = max(top, float(counts.max()) if counts.size else 0.0)
+
+            area = QAreaSeries(upper)
+            area.setName(str(name))
+            color = QColor(_PLOT_COLORS[i % len(_PLOT_COLORS)])
+            area.setPen(QPen(color, 1))
+            color.setAlphaF(0.3 if layered else 0.8)
+            area.setBrush(color)
+            chart.addSeries(area)
+            # the area keeps a reference to its boundary series, Python must too
+            area._upper = upper
+
+        mean = self.plot_data["mean"]
+        if mean is not None:
+            line = QLineSeries()
+            line.setName("mean")
+            line.append(mean, 0.0)
+            line.append(mean, top)
+            line.setPen(QPen(QColor("red"), 3, Qt.DashLine))
+            chart.addSeries(line)
+
+    def _addScatterSeries(self, chart):
+        for i, (name, x, y) in enumerate(self.plot_data["series"]):
+            series = QScatterSeries()
+            series.setName(str(name))
+            series.setMarkerSize(6)
+            series.setColor(QColor(_PLOT_COLORS[i % len(_PLOT_COLORS)]))
+            series.setBorderColor(Qt.transparent)
+            series.replace([QPointF(float(px), float(py)) for px, py in zip(x, y)])
+            chart.addSeries(series)
+
+        for x0, y0, x1, y1 in self.plot_data["trendlines"]:
+            line = QLineSeries()
+            line.append(float(x0), float(y0))
+            line.append(float(x1), float(y1))
+            line.setPen(QPen(QColor("red"), 2))
+            chart.addSeries(line)
+            for marker in chart.legend().markers(line):
+                marker.setVisible(False)
+
+    def setPlotVisible(self, visible):
+        pass
+
+    def releaseContent(self):
+        pass
+
+    def mouseDoubleClickEvent(self, event):
+        # another chart with the same name may have overwritten the file, the generator cache knows
+        self.html_file_path = self.html_factory()
+        super().mouseDoubleClickEvent(event)
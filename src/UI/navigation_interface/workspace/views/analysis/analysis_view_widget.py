@@ -1,12 +1,16 @@
+import functools
 import os
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QEvent, QPoint, QRect
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout
 from UI.dialogs.custom_info_bar import CustomInfoBar, InfoBarPosition
 from UI.dialogs.plot_view_widget import PlotViewerWidget
-from UI.navigation_interface.workspace.views.analysis.analysis_card import AnalysisCard
+from UI.navigation_interface.workspace.views.analysis.analysis_card import (AnalysisCard, ImageAnalysisCard,
+                                                                           NativeAnalysisCard, WebViewPool,
+                                                                           configure_web_profile)
 from UI.navigation_interface.workspace.views.analysis.chart_creation_dialog import ChartCreationDialog
 from UI.utils.flow_gallery import FlowGallery
+from backend.config import ANALYSIS_NATIVE_CARDS
 from backend.plot_generator import PlotGenerator
 from qfluentwidgets import PrimaryPushButton
 
@@ -26,12 +30,17 @@ class AnalysisViewWidget(QWidget):
         self.main_window_reference = main_window_reference
         self.analysis_presenter = None
         self.plot_generator = None
+        self.analysis_cards = []
+        # cards holding a live web view, loaded and unloaded as the gallery scrolls (Plotly mode only)
+        self._web_cards = []
+        # created on the first double click and reused, closing it only hides it
+        self._plot_viewer = None
 
         self.__initWidget()
 
     def __initWidget(self):
         """Initialize the layout and appearance of the analysis view."""
-        self.vBoxLayout.setContentsMargins(30, 20, 30, 30)  # Adjust margins as needed
+        self.vBoxLayout.setContentsMargins(20, 20, 20, 20)  # Adjust margins as needed; the gallery's border image adds 10px of shadow
         self.vBoxLayout.addLayout(self.buttonLayout)
         self.vBoxLayout.addWidget(self.gallery)
 
@@ -43,6 +52,34 @@ class AnalysisViewWidget(QWidget):
         self.createChartButton.clicked.connect(self.openChartCreationDialog)
         self.runSegmentationButton.clicked.connect(self.runSegmentation)
 
+        # all plot web views share the default profile, so Plotly's assets are cached once on disk
+        configure_web_profile()
+
+        if not ANALYSIS_NATIVE_CARDS:
+            # web cards load their plot only while they are near the visible part of the gallery
+            self.gallery.scroll_area.verticalScrollBar().valueChanged.connect(self._update_visible_cards)
+            self.gallery.scroll_area.viewport().installEventFilter(self)
+            # warm up the web views for the analysis cards once the event loop is running
+            QTimer.singleShot(0, WebViewPool.instance().preload)
+
+    def eventFilter(self, obj, e):
+        if obj is self.gallery.scroll_area.viewport() and e.type() == QEvent.Resize:
+            self._update_visible_cards()
+        return super().eventFilter(obj, e)
+
+    def _update_visible_cards(self):
+        """Loads the cards in the viewport and unloads the ones more than a viewport height away."""
+        viewport = self.gallery.scroll_area.viewport()
+        visible = viewport.rect()
+        margin = visible.height()
+        nearby = visible.adjusted(0, -margin, 0, margin)
+        for card in self._web_cards:
+            rect = QRect(card.mapTo(viewport, QPoint(0, 0)), card.size())
+            if rect.intersects(visible):
+                card.setPlotVisible(True)
+            elif not rect.intersects(nearby):
+                card.setPlotVisible(False)
+
     def set_presenter(self, analysis_presenter):
         self.analysis_presenter = analysis_presenter
         self.plot_generator = PlotGenerator(self.analysis_presenter.data_manager)
@@ -50,7 +87,7 @@ class AnalysisViewWidget(QWidget):
 
     def openChartCreationDialog(self):
         """Open the chart creation dialog."""
-        if not all([image.mask_id is not None for image in self.analysis_presenter.data_manager.samples.values()]):
+        if self.analysis_presenter.data_manager.samples_without_mask():
             CustomInfoBar.error(
                 title='Masks required',
                 content=f"Please extract masks for all images before creating charts.",
@@ -83,21 +120,51 @@ class AnalysisViewWidget(QWidget):
             return
 
         plot_name = parameters.x_variable
-        plot_png_path, plot_html_path = self.plot_generator.generate_plot(selected_chart_type, parameters, plot_name) # Pass the plot name
-
-        if plot_html_path:
-            card = AnalysisCard(plot_html_path, self)  # Pass HTML file path to the card
-            self.gallery.flow_layout.addWidget(card)
-            card.doubleClicked.connect(self.open_plot_viewer) # Correct signal connection
-            card.deleteRequested.connect(lambda: self.delete_analysis_card(card))
+        if ANALYSIS_NATIVE_CARDS:
+            plot_data = self.plot_generator.generate_plot_native(selected_chart_type, parameters)
+            if plot_data is None:
+                return
+            html_factory = functools.partial(self._generate_plot_html, selected_chart_type, parameters, plot_name)
+            card = NativeAnalysisCard(plot_data, html_factory, self)
+        else:
+            plot_png_path, plot_html_path = self.plot_generator.generate_plot(selected_chart_type, parameters, plot_name) # Pass the plot name
+            if not plot_html_path:
+                return
+            if plot_png_path:
+                card = ImageAnalysisCard(plot_png_path, plot_html_path, self)
+            else:
+                card = AnalysisCard(plot_html_path, self)  # Pass HTML file path to the card
+                self._web_cards.append(card)
+                QTimer.singleShot(0, self._update_visible_cards)
+
+        self.gallery.flow_layout.addWidget(card)
+        self.analysis_cards.append(card)
+        card.doubleClicked.connect(self.open_plot_viewer) # Correct signal connection
+        card.deleteRequested.connect(self._onDeleteRequested)
+
+    def _generate_plot_html(self, chart_type, parameters, plot_name):
+        """Builds the interactive Plotly HTML of a native card for the plot viewer."""
+        plot_png_path, plot_html_path = self.plot_generator.generate_plot(chart_type, parameters, plot_name)
+        return plot_html_path
 
     def open_plot_viewer(self, html_file_path):
         """Opens the PlotViewerWidget."""
         absolute_html_path = os.path.abspath(html_file_path)  # Get the absolute path
-        self.plot_viewer = PlotViewerWidget(absolute_html_path, self)  # Use the absolute path
-        self.plot_viewer.show()
+        if self._plot_viewer is None:
+            self._plot_viewer = PlotViewerWidget(absolute_html_path, self)  # Use the absolute path
+        else:
+            self._plot_viewer.load_plot(absolute_html_path)
+        self._plot_viewer.show()
+        self._plot_viewer.raise_()
+
+    def _onDeleteRequested(self):
+        self.delete_analysis_card(self.sender())
 
     def delete_analysis_card(self, card: AnalysisCard):
         """Removes the specified AnalysisCard from the layout."""
         self.gallery.flow_layout.removeWidget(card)
+        self.analysis_cards.remove(card)
+        if card in self._web_cards:
+            self._web_cards.remove(card)
+        card.releaseContent()
         card.deleteLater()
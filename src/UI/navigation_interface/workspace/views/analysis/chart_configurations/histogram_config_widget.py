@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QGroupBox, QSpinBox, QCheckBox, QRadioButton, QButtonGroup
 )
-from UI.navigation_interface.workspace.views.analysis.chart_configurations.parameter_holders import HistogramParameters
+from UI.navigation_interface.workspace.views.analysis.chart_configurations.parameter_holders import HistogramParameters, PROPERTIES
 
 
 class HistogramConfigWidget(QWidget):
@@ -18,25 +18,8 @@ class HistogramConfigWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Store properties
-        self.properties = [
-            "area",
-            "perimeter",
-            "eccentricity",
-            "solidity",
-            "aspect_ratio",
-            "circularity",
-            "major_axis_length",
-            "minor_axis_length",
-            "mean_intensity",
-            "std_intensity",
-            "compactness",
-            "convexity",
-            "curl",
-            "volume"
-        ]
         self.default_params = HistogramParameters(
-            x_variable=self.properties[0],
+            x_variable=PROPERTIES[0],
             num_bins=10,
             show_mean=True,
             relative_frequency=False,
@@ -78,7 +61,7 @@ class HistogramConfigWidget(QWidget):
         self.x_variable_group = QGroupBox("Select X Variable")
         layout = QHBoxLayout()
         self.x_variable_combobox = QComboBox()
-        self.x_variable_combobox.addItems(self.properties)
+        self.x_variable_combobox.addItems(list(PROPERTIES))
         self.x_variable_combobox.setCurrentText(self.default_params.x_variable)
         layout.addWidget(QLabel("X-axis:"))
         layout.addWidget(self.x_variable_combobox)
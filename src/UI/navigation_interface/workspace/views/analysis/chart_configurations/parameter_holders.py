@@ -1,6 +1,36 @@
+import logging
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
+# Mask properties that can be plotted, shared by the chart configuration widgets
+PROPERTIES = (
+    "area", "perimeter", "eccentricity", "solidity",
+    "aspect_ratio", "circularity", "major_axis_length",
+    "minor_axis_length", "mean_intensity", "std_intensity",
+    "compactness", "convexity", "curl", "volume"
+)
+
+
+def _masked_attributes(data_manager, columns):
+    """
+    Gathers the given mask attributes for every sample that has a mask, in one vectorized lookup.
+    Samples whose mask or attributes are missing are skipped.
+
+    Returns:
+        tuple: (list of samples, array with one row per sample and one column per requested attribute)
+    """
+    samples = [image for image in data_manager.samples.values() if image.mask_id]
+    values = data_manager.get_mask_attributes([image.mask_id for image in samples], columns)
+
+    complete = ~np.isnan(values).any(axis=1)
+    if not complete.all():
+        logging.warning("Properties %s not found for %d images. Skipping.", columns, int((~complete).sum()))
+        samples = [image for image, keep in zip(samples, complete) if keep]
+        values = values[complete]
+    return samples, values
+
 
 @dataclass
 class HistogramParameters:
@@ -13,22 +43,17 @@ class HistogramParameters:
 
     def get_data(self, data_manager):
         """Retrieves data from the DataManager based on the parameters."""
-        x_data = []
-        group_data = []
-
-        for image in data_manager.samples.values():
-            if image.mask_id: # Check if mask exists
-                try:
-                    x_data.append(data_manager.masks[image.mask_id].attributes[self.x_variable])
-                    if self.group_by == "class":
-                        group_data.append(data_manager.classes[image.class_id].name if image.class_id else "Uncategorized")
-                    elif self.group_by == "cluster":
-                        cluster = next((c for c in data_manager.clusters.values() if image in c.samples), None)
-                        group_data.append(cluster.id[:8] if cluster else "No Cluster")  # Shorten cluster ID
-                    else: # Simple plot - group data by image id for compatibility.
-                        group_data.append(image.id)
-                except KeyError:
-                    print(f"Warning: Property '{self.x_variable}' not found for image {image.id}. Skipping.")
+        samples, values = _masked_attributes(data_manager, [self.x_variable])
+        x_data = values[:, 0]
+
+        if self.group_by == "class":
+            group_data = [data_manager.classes[image.class_id].name if image.class_id else "Uncategorized"
+                          for image in samples]
+        elif self.group_by == "cluster":
+            group_data = [cluster.id[:8] if cluster else "No Cluster"  # Shorten cluster ID
+                          for cluster in (data_manager.cluster_of(image.id) for image in samples)]
+        else: # Simple plot - group data by image id for compatibility.
+            group_data = [image.id for image in samples]
 
         return x_data, group_data
 
@@ -44,33 +69,25 @@ class ScatterParameters:
 
     def get_data(self, data_manager):
         """Retrieve data for scatter plot."""
-        x_data = []
-        y_data = []
-        size_data = []
-        color_data = []
-
-        for image in data_manager.samples.values():
-            if image.mask_id:
-                try:
-                    x_data.append(data_manager.masks[image.mask_id].attributes[self.x_variable])
-                    y_data.append(data_manager.masks[image.mask_id].attributes[self.y_variable])
-
-                    if self.size_variable:
-                        size_data.append(data_manager.masks[image.mask_id].attributes[self.size_variable])
-                    else:
-                        size_data.append(1) # Uniform size
-
-
-                    if self.color_variable == "Class":
-                        color_data.append(data_manager.classes[image.class_id].name if image.class_id else "Uncategorized")
+        columns = [self.x_variable, self.y_variable]
+        if self.size_variable:
+            columns.append(self.size_variable)
+        samples, values = _masked_attributes(data_manager, columns)
 
-                    elif self.color_variable == "Cluster":
-                        cluster = next((c for c in data_manager.clusters.values() if image in c.samples), None)
-                        color_data.append(cluster.id[:8] if cluster else "No Cluster") # Shorten cluster ID
+        x_data = values[:, 0]
+        y_data = values[:, 1]
+        if self.size_variable:
+            size_data = values[:, 2]
+        else:
+            size_data = np.ones(len(samples)) # Uniform size
 
-                    else:  # No coloring
-                        color_data.append("All data")
+        if self.color_variable == "Class":
+            color_data = [data_manager.classes[image.class_id].name if image.class_id else "Uncategorized"
+                          for image in samples]
+        elif self.color_variable == "Cluster":
+            color_data = [cluster.id[:8] if cluster else "No Cluster" # Shorten cluster ID
+                          for cluster in (data_manager.cluster_of(image.id) for image in samples)]
+        else:  # No coloring
+            color_data = ["All data"] * len(samples)
 
-                except KeyError as e:
-                    print(f"Warning: Property '{e}' not found for image {image.id}. Skipping.")
         return x_data, y_data, size_data, color_data
\ No newline at end of file
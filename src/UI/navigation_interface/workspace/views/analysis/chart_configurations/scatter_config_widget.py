@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QComboBox, QLabel,
     QGroupBox, QRadioButton, QButtonGroup
 )
-from UI.navigation_interface.workspace.views.analysis.chart_configurations.parameter_holders import ScatterParameters
+from UI.navigation_interface.workspace.views.analysis.chart_configurations.parameter_holders import ScatterParameters, PROPERTIES
 
 
 class ScatterConfigWidget(QWidget):
@@ -12,15 +12,9 @@ class ScatterConfigWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.properties = [  # List of properties for selection
-            "area", "perimeter", "eccentricity", "solidity",
-            "aspect_ratio", "circularity", "major_axis_length",
-            "minor_axis_length", "mean_intensity", "std_intensity",
-            "compactness", "convexity", "curl", "volume"
-        ]
         self.params = ScatterParameters(
-            x_variable=self.properties[0],
-            y_variable=self.properties[1],
+            x_variable=PROPERTIES[0],
+            y_variable=PROPERTIES[1],
             size_variable=None,  # Initial size is uniform
             color_variable=None,
             trendline="global",
@@ -58,9 +52,9 @@ class ScatterConfigWidget(QWidget):
         self.variables_group = QGroupBox("Select Variables")
         layout = QGridLayout()
         self.x_variable = QComboBox()
-        self.x_variable.addItems(self.properties)
+        self.x_variable.addItems(list(PROPERTIES))
         self.y_variable = QComboBox()
-        self.y_variable.addItems(self.properties)
+        self.y_variable.addItems(list(PROPERTIES))
         layout.addWidget(QLabel("X Variable:"), 0, 0)
         layout.addWidget(self.x_variable, 0, 1)
         layout.addWidget(QLabel("Y Variable:"), 1, 0)
@@ -72,7 +66,7 @@ class ScatterConfigWidget(QWidget):
         layout = QHBoxLayout()
         self.size_variable = QComboBox()
         self.size_variable.addItem("Uniform")  # For uniform marker size
-        self.size_variable.addItems(self.properties)
+        self.size_variable.addItems(list(PROPERTIES))
         layout.addWidget(QLabel("Size Variable"), 0)
         layout.addWidget(self.size_variable, 1)
         self.size_group.setLayout(layout)
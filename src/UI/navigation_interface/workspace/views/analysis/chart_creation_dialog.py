@@ -23,6 +23,7 @@ class ChartCreationDialog(MessageBoxBase):
         self.chartTypeSelector = SegmentedWidget(self)
         self.chartTypeSelector.setFixedHeight(30)
         self.chartOptionsStackedWidget = QStackedWidget(self)
+        self._chartWidgets = {}  # route key -> chart options widget
 
         # Initialize plot options widgets
         self.histogramConfig = HistogramConfigWidget(self)
@@ -62,15 +63,12 @@ class ChartCreationDialog(MessageBoxBase):
         """Helper function to add chart types to the segmented widget and stacked widget."""
         widget.setObjectName(route_key + "Options")
         self.chartOptionsStackedWidget.addWidget(widget)
+        self._chartWidgets[route_key] = widget
         self.chartTypeSelector.addItem(routeKey=route_key, text=label)
 
     def _find_chart_options_widget(self, route_key: str) -> QWidget:
         """Finds the chart options widget based on the route key."""
-        for i in range(self.chartOptionsStackedWidget.count()):
-            widget = self.chartOptionsStackedWidget.widget(i)
-            if widget.objectName() == f"{route_key}Options":
-                return widget
-        return self.histogramConfig  # Default fallback
+        return self._chartWidgets.get(route_key, self.histogramConfig)  # Default fallback
 
     def create_plot(self):
         """Handles the Create button click to generate and display the plot."""
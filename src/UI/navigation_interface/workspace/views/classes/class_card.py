@@ -1,9 +1,11 @@
 import random
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QColor, QPainterPath, QPainter, QPen, QContextMenuEvent, QMouseEvent
 from PySide6.QtWidgets import QVBoxLayout, QMenu
+from UI.utils.pixmap_cache import ThumbnailLoader
+from backend.config import CLASS_CARD_IMAGE_HEIGHT
 from qfluentwidgets import ImageLabel, CaptionLabel, CardWidget, isDarkTheme
 
 
@@ -11,15 +13,27 @@ class ClassCard(CardWidget):
     """ Gallery card """
     class_double_clicked = Signal(str)
 
-    def __init__(self, iconPath: str, classes_presenter, class_id: str, parent=None):
+    # Theme colors, shared by all cards
+    _lightNormalBackgroundColor = QColor(255, 255, 255, 170)
+    _darkNormalBackgroundColor = QColor(255, 255, 255, 13)
+    _lightHoverBackgroundColor = QColor(230, 230, 230, 64)
+    _darkHoverBackgroundColor = QColor(230, 230, 230, 90)
+    _defaultBorderColor = QColor(240, 240, 240, 60)
+    _darkPressedBorderColor = QColor(255, 255, 255, 18)
+    _darkHoverBorderColor = QColor(255, 255, 255, 13)
+    _lightHoverBottomBorderColor = QColor(0, 0, 0, 27)
+
+    def __init__(self, iconPath: str, classes_presenter, class_id: str, parent=None, class_color: QColor = None):
         super().__init__(parent)
         self._borderRadius = 10
-        self.iconWidget = ImageLabel(iconPath, self)
+        # the preview is decoded once the card is first painted, see _loadIcon
+        self.iconWidget = ImageLabel(self)
+        self._iconPath = iconPath
+        self._iconLoaded = False
         self.label = CaptionLabel(Path(iconPath).stem, self)
         self.classes_presenter = classes_presenter
         self.class_id = class_id
-
-        self.iconWidget.scaledToHeight(95)
+        self._contextMenu = None  # built on the first right-click
 
         self.vBoxLayout = QVBoxLayout(self)
         self.vBoxLayout.setAlignment(Qt.AlignCenter)
@@ -30,33 +44,44 @@ class ClassCard(CardWidget):
 
         self.card_height = 136
         self.card_width = 128
-        # create random color
-        random_color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-        self.class_color = QColor(*random_color, 70)
+        if class_color is None:
+            # create random color
+            random_color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+            class_color = QColor(*random_color, 70)
+        self.class_color = class_color
+
+        # pen of the background border, only its color changes between paints
+        self._borderPen = QPen()
+        self._borderPen.setWidth(6)
 
         self.setFixedSize(self.card_width, self.card_height)
+        self._rebuildPaths()
 
         self.class_double_clicked.connect(self.classes_presenter.show_class_viewer)
 
     def _normalBackgroundColor(self):
-        return QColor(255, 255, 255, 13 if isDarkTheme() else 170)
+        return self._darkNormalBackgroundColor if isDarkTheme() else self._lightNormalBackgroundColor
 
     def _hoverBackgroundColor(self):
-        return QColor(230, 230, 230, 90 if isDarkTheme() else 64)
+        return self._darkHoverBackgroundColor if isDarkTheme() else self._lightHoverBackgroundColor
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing)
+    def _loadIcon(self):
+        ThumbnailLoader.instance().request(self._iconPath, CLASS_CARD_IMAGE_HEIGHT, self.iconWidget.setPixmap)
 
+    def setIconPath(self, iconPath: str):
+        """Replaces the preview image, decoding it right away only if the card was already painted."""
+        self._iconPath = iconPath
+        if self._iconLoaded:
+            self._loadIcon()
+
+    def _rebuildPaths(self):
+        """Builds the border paths for the current size, the card only repaints them."""
         w, h = self.width(), self.height()
         r = self.borderRadius
         d = 2 * r
 
-        isDark = isDarkTheme()
-
-        # draw top border
+        # top border
         path = QPainterPath()
-        # path.moveTo(1, h - r)
         path.arcMoveTo(1, h - d - 1, d, d, 240)
         path.arcTo(1, h - d - 1, d, d, 225, -60)
         path.lineTo(1, r)
@@ -65,45 +90,65 @@ class ClassCard(CardWidget):
         path.arcTo(w - d - 1, 1, d, d, 90, -90)
         path.lineTo(w - 1, h - r)
         path.arcTo(w - d - 1, h - d - 1, d, d, 0, -60)
+        self._topPath = path
+
+        # bottom border
+        path = QPainterPath()
+        path.arcMoveTo(1, h - d - 1, d, d, 240)
+        path.arcTo(1, h - d - 1, d, d, 240, 30)
+        path.lineTo(w - r - 1, h - 1)
+        path.arcTo(w - d - 1, h - d - 1, d, d, 270, 30)
+        self._bottomPath = path
+
+        self._bgRect = self.rect().adjusted(1, 1, -1, -1)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._rebuildPaths()
+
+    def paintEvent(self, e):
+        if not self._iconLoaded:
+            # load after this paint, the icon resizes the label and relayouts the card
+            self._iconLoaded = True
+            QTimer.singleShot(0, self._loadIcon)
 
-        topBorderColor = QColor(240, 240, 240, 60)
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.Antialiasing)
+
+        r = self.borderRadius
+        isDark = isDarkTheme()
+
+        # draw top border
+        topBorderColor = self._defaultBorderColor
         if isDark:
             if self.isPressed:
-                topBorderColor = QColor(255, 255, 255, 18)
+                topBorderColor = self._darkPressedBorderColor
             elif self.isHover:
-                topBorderColor = QColor(255, 255, 255, 13)
+                topBorderColor = self._darkHoverBorderColor
         else:
             topBorderColor = self.class_color
 
-        painter.strokePath(path, topBorderColor)
+        painter.strokePath(self._topPath, topBorderColor)
 
         # draw bottom border
-        path = QPainterPath()
-        path.arcMoveTo(1, h - d - 1, d, d, 240)
-        path.arcTo(1, h - d - 1, d, d, 240, 30)
-        path.lineTo(w - r - 1, h - 1)
-        path.arcTo(w - d - 1, h - d - 1, d, d, 270, 30)
-
         bottomBorderColor = topBorderColor
         if not isDark and self.isHover and not self.isPressed:
-            bottomBorderColor = QColor(0, 0, 0, 27)
+            bottomBorderColor = self._lightHoverBottomBorderColor
 
-        painter.strokePath(path, bottomBorderColor)
+        painter.strokePath(self._bottomPath, bottomBorderColor)
 
         # draw background and border
-        pen = QPen(topBorderColor)
-        pen.setWidth(6)
-        painter.setPen(pen)
-        rect = self.rect().adjusted(1, 1, -1, -1)
+        self._borderPen.setColor(topBorderColor)
+        painter.setPen(self._borderPen)
         painter.setBrush(self.backgroundColor)
-        painter.drawRoundedRect(rect, r, r)
+        painter.drawRoundedRect(self._bgRect, r, r)
 
     def mouseReleaseEvent(self, e):  # Emit clicked signal on mouse release
         super().mouseReleaseEvent(e)
         self.clicked.emit()
 
-    def contextMenuEvent(self, event: QContextMenuEvent):
-        """Handles right-click context menu event."""
+    def _buildContextMenu(self):
+        """Creates the context menu and connects its actions once, the card's class never changes."""
         menu = QMenu(self)
         menu.setStyleSheet("QMenu {background-color: #234f4b; color: white;}")
         show_summary_action = menu.addAction("Show Summary")
@@ -115,8 +160,13 @@ class ClassCard(CardWidget):
             show_summary_action.triggered.connect(lambda: self.classes_presenter.show_summary(self.class_id))
             rename_action.triggered.connect(lambda: self.classes_presenter.handle_rename_class(self.class_id))
             delete_action.triggered.connect(lambda: self.classes_presenter.delete_class(self.class_id))
+        return menu
 
-        menu.exec_(event.globalPos())
+    def contextMenuEvent(self, event: QContextMenuEvent):
+        """Handles right-click context menu event."""
+        if self._contextMenu is None:
+            self._contextMenu = self._buildContextMenu()
+        self._contextMenu.exec_(event.globalPos())
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         """Handles double-click events."""
@@ -1,6 +1,5 @@
 import logging
 
-from PIL.ImageQt import QPixmap
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
@@ -20,10 +19,28 @@ from qfluentwidgets.components.material import AcrylicLineEdit
 from qfluentwidgets.components.widgets.flyout import FlyoutAnimationType
 
 
+# The tree frame and its label share one sheet. The Fluent tree and button apply their own
+# sheets, which a parent sheet can't override, so they keep per-widget ones.
+_TREE_FRAME_QSS = """
+    QFrame#treeFrame {
+        background-color: white;
+        border-radius: 8px; /* Rounded corners */
+    }
+    QLabel#treeLabel {
+        background-color: white;
+        border-radius: 8px;
+        color: #333333;
+        padding: 5px;
+        border-bottom: 1px solid #d0d0d0; /* Add bottom border */
+    }
+"""
+
+
 class ClassesViewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.classes = []  # Store references to ClassCard objects
+        self._class_index = {}  # class_id -> ClassCard, for constant-time lookups
 
         # Initialize the class gallery
         self.class_gallery = FlowGallery(self)  # Create the class gallery
@@ -59,13 +76,9 @@ class ClassesViewWidget(QWidget):
 
         # Create a frame to contain the tree view and the button
         self.tree_frame = QFrame(self)
+        self.tree_frame.setObjectName("treeFrame")
         self.tree_frame.setFrameShape(QFrame.NoFrame)  # Remove frame border
-        self.tree_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px; /* Rounded corners */
-            }
-        """)
+        self.tree_frame.setStyleSheet(_TREE_FRAME_QSS)
 
         # Apply Subtle Shadow Effect to the Frame (optional, based on previous designs)
         # Uncomment the following lines if you wish to have a subtle shadow
@@ -107,15 +120,9 @@ class ClassesViewWidget(QWidget):
 
         # Label for the tree view
         self.tree_label = QLabel("Class Hierarchy", self.tree_frame)
+        self.tree_label.setObjectName("treeLabel")
         self.tree_label.setAlignment(Qt.AlignCenter)
         self.tree_label.setFont(QFont("Arial", 11))
-        self.tree_label.setStyleSheet("""
-            QLabel {
-                color: #333333;
-                padding: 5px;
-                border-bottom: 1px solid #d0d0d0; /* Add bottom border */
-            }
-        """)
 
         # Add the label to the layout
         self.tree_layout.addWidget(self.tree_label)
@@ -204,18 +211,46 @@ class ClassesViewWidget(QWidget):
         # You can close the flyout here if you want:
         self.create_class_flyout.close()
 
-    def create_class_card(self, class_name, class_id, class_color, preview_image_path):
-        """Creates and adds a new ClassCard to the gallery."""
-        card = ClassCard(preview_image_path, self.classes_presenter, class_id, self)
+    def _build_class_card(self, class_name, class_id, class_color, preview_image_path):
+        """Creates a ClassCard and registers it, without adding it to the gallery."""
+        card = ClassCard(preview_image_path, self.classes_presenter, class_id, self, QColor(class_color))
         card.label.setText(class_name)  # Set the class name on the card
-        card.class_color = QColor(class_color)  # Set the class color
         self.classes.append(card)
+        self._class_index[class_id] = card
+        return card
+
+    def create_class_card(self, class_name, class_id, class_color, preview_image_path):
+        """Creates and adds a new ClassCard to the gallery."""
+        card = self._build_class_card(class_name, class_id, class_color, preview_image_path)
         self.class_gallery.flow_layout.addWidget(card)
         return card
 
+    def create_class_cards(self, entries):
+        """
+        Creates and adds several ClassCards with a single gallery relayout.
+
+        Args:
+            entries: (class_name, class_id, class_color, preview_image_path) tuples.
+
+        Returns:
+            list: The created ClassCards.
+        """
+        self.class_gallery.begin_batch()
+        try:
+            cards = [self._build_class_card(*entry) for entry in entries]
+            for card in cards:
+                self.class_gallery.add_item(card)
+        finally:
+            self.class_gallery.end_batch()
+        return cards
+
+    def get_class_card(self, class_id):
+        """Returns the ClassCard with the given class_id, or None."""
+        return self._class_index.get(class_id)
+
     def delete_class_card(self, class_id):
         """Deletes the ClassCard with the given class_id."""
-        card_to_delete = next((card for card in self.classes if card.class_id == class_id), None)
+        card_to_delete = self._class_index.pop(class_id, None)
         if card_to_delete:
             self.class_gallery.flow_layout.removeWidget(card_to_delete)
             self.classes.remove(card_to_delete)
@@ -223,11 +258,9 @@ class ClassesViewWidget(QWidget):
 
     def update_class_card(self, class_id, preview_image_path):
         """Updates the preview image of the ClassCard with the given class_id."""
-        card_to_update = next((card for card in self.classes if card.class_id == class_id), None)
+        card_to_update = self._class_index.get(class_id)
         if card_to_update:
-            card_to_update.iconWidget.setPixmap(QPixmap(preview_image_path))
-            card_to_update.iconWidget.setScaledContents(True)
-            card_to_update.iconWidget.setFixedHeight(95)
+            card_to_update.setIconPath(preview_image_path)
 
     def set_presenter(self, presenter):
         """Sets the ClassesPresenter for this widget."""
@@ -237,10 +270,11 @@ class ClassesViewWidget(QWidget):
         """Clears all class cards from the gallery and tree view."""
         logging.info("Clearing all classes from ClassesViewWidget.")
         # Clear class cards
+        self.class_gallery.clear_items()
         for card in self.classes:
-            self.class_gallery.flow_layout.removeWidget(card)
             card.deleteLater()
         self.classes.clear()
+        self._class_index.clear()
 
         # Clear tree view
         self.class_tree_view.clear()
@@ -1,9 +1,10 @@
 import logging
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal, QMimeData
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QMouseEvent, QDrag
+from PySide6.QtCore import Qt, Signal, QMimeData, QTimer
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QMouseEvent, QDrag
 from PySide6.QtWidgets import QApplication, QVBoxLayout
+from UI.utils.pixmap_cache import ThumbnailLoader
 from backend.config import CLUSTERS_CARD_IMAGE_HEIGHT, CLUSTERS_CARD_WIDTH, CLUSTERS_CARD_HEIGHT
 from qfluentwidgets import ImageLabel, BodyLabel, isDarkTheme, CardWidget
 
@@ -17,17 +18,37 @@ class ClustersCard(CardWidget):
     cluster_double_clicked = Signal(str)
     card_clicked = Signal(str, Qt.KeyboardModifiers, Qt.MouseButton)
 
+    # Theme colors, shared by all cards
+    _lightNormalBackgroundColor = QColor(255, 255, 255, 170)
+    _darkNormalBackgroundColor = QColor(255, 255, 255, 13)
+    _lightHoverBackgroundColor = QColor(237, 255, 245, 64)
+    _darkHoverBackgroundColor = QColor(237, 255, 245, 90)
+    _lightPressedBackgroundColor = QColor(255, 255, 255, 64)
+    _darkPressedBackgroundColor = QColor(255, 255, 255, 150)
+    _defaultBorderColor = QColor(240, 240, 240, 60)
+    _darkPressedBorderColor = QColor(255, 255, 255, 18)
+    _darkHoverBorderColor = QColor(255, 255, 255, 13)
+    _lightHoverBottomBorderColor = QColor(0, 0, 0, 27)
+    # selected state: teal base color, darker for the tracing
+    _lightTracingColor = QColor(50, 180, 165).darker(200)
+    _darkTracingColor = QColor(50, 180, 165).darker(150)
+    _filmColor = QColor(0, 0, 0, 0)  # Translucent film
+
     def __init__(self, iconPath: str, cluster_id: str, parent=None):
         super().__init__(parent)
         self.cluster_id = cluster_id  # Unique identifier for the cluster
         self._borderRadius = 10
-        self.iconWidget = ImageLabel(iconPath, self)
+        # the preview is decoded once the card is first painted, see _loadIcon
+        self.iconWidget = ImageLabel(self)
+        self._iconPath = iconPath
+        self._iconLoaded = False
         self.label = BodyLabel(Path(iconPath).stem, self)
         self.clusters_presenter = None
         self.selected = False
         self.cluster_color = None
-
-        self.iconWidget.scaledToHeight(CLUSTERS_CARD_IMAGE_HEIGHT)
+        # unselected background, see paintEvent
+        self._bgPixmap = None
+        self._bgKey = None
 
         self.vBoxLayout = QVBoxLayout(self)
         self.vBoxLayout.setAlignment(Qt.AlignCenter)
@@ -39,92 +60,135 @@ class ClustersCard(CardWidget):
         self.card_height = CLUSTERS_CARD_HEIGHT
         self.card_width = CLUSTERS_CARD_WIDTH
 
+        # pens of the background border and the selection trace, only their colors change between paints
+        self._borderPen = QPen()
+        self._borderPen.setWidth(6)
+        self._tracePen = QPen(self._lightTracingColor, 6, Qt.DashLine)
+
         self.setFixedSize(self.card_width, self.card_height)
+        self._rebuildPaths()
 
         # Enable dragging and dropping
         self.setAcceptDrops(True)
 
         # Variables to track dragging state
         self.drag_start_position = None
+        # cluster being dragged over this card, read from the mime data once on drag enter
+        self._dragSourceId = None
+        self._dragAccepted = False
+        # scaled snapshot shown while dragging this card, re-grabbed when its look changes
+        self._dragPixmap = None
+        self._dragPixmapKey = None
 
     def _normalBackgroundColor(self):
-        return QColor(255, 255, 255, 13 if isDarkTheme() else 170)
+        return self._darkNormalBackgroundColor if isDarkTheme() else self._lightNormalBackgroundColor
 
     def _hoverBackgroundColor(self):
-        return QColor(237, 255, 245, 90 if isDarkTheme() else 64)
+        return self._darkHoverBackgroundColor if isDarkTheme() else self._lightHoverBackgroundColor
 
     def _pressedBackgroundColor(self):
-        return QColor(255, 255, 255, 150 if isDarkTheme() else 64)
+        return self._darkPressedBackgroundColor if isDarkTheme() else self._lightPressedBackgroundColor
+
+    def _loadIcon(self):
+        ThumbnailLoader.instance().request(self._iconPath, CLUSTERS_CARD_IMAGE_HEIGHT, self.iconWidget.setPixmap)
+
+    def _rebuildPaths(self):
+        """Builds the border and selection trace paths for the current size, the card only repaints them."""
+        w, h = self.width(), self.height()
+        r = self._borderRadius
+        d = 2 * r
+
+        # top border
+        path = QPainterPath()
+        path.arcMoveTo(1, h - d - 1, d, d, 240)
+        path.arcTo(1, h - d - 1, d, d, 225, -60)
+        path.lineTo(1, r)
+        path.arcTo(1, 1, d, d, -180, -90)
+        path.lineTo(w - r, 1)
+        path.arcTo(w - d - 1, 1, d, d, 90, -90)
+        path.lineTo(w - 1, h - r)
+        path.arcTo(w - d - 1, h - d - 1, d, d, 0, -60)
+        self._topPath = path
+
+        # tracing (inner border) of the selected state
+        path = QPainterPath()
+        path.addRoundedRect(4, 4, w - 8, h - 8, r-2, r-2) # More inset and slightly smaller radius
+        self._tracePath = path
+
+        self._bgRect = self.rect().adjusted(1, 1, -1, -1)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._rebuildPaths()
+        self._bgPixmap = None
+        self._dragPixmap = None
 
     def paintEvent(self, e):
+        if not self._iconLoaded:
+            # load after this paint, the icon resizes the label and relayouts the card
+            self._iconLoaded = True
+            QTimer.singleShot(0, self._loadIcon)
+
         painter = QPainter(self)
         painter.setRenderHints(QPainter.Antialiasing)
 
-        w, h = self.width(), self.height()
         r = self._borderRadius
-        d = 2 * r
 
         isDark = isDarkTheme()
-        topBorderColor = QColor(240, 240, 240, 60)
-        path = QPainterPath()
+        topBorderColor = self._defaultBorderColor
 
-        # Define colors
-        base_color = QColor(50, 180, 165)  # Teal base color for selected state
-        top_border_color = base_color.lighter(150)  # Slightly lighter for top border
-        tracing_color = base_color.darker(150) if isDark else base_color.darker(200)  # Darker for tracing
-        film_color = QColor(0, 0, 0, 0) if isDark else QColor(0, 0, 0, 0) # Translucent white or black film
+        if not self.selected:
+            if isDark:
+                if self.isPressed:
+                    topBorderColor = self._darkPressedBorderColor
+                elif self.isHover:
+                    topBorderColor = self._darkHoverBorderColor
+            elif self.cluster_color:  # Use cluster color if available
+                topBorderColor = QColor(self.cluster_color)
+
+        bottomBorderColor = topBorderColor
+        if not isDark and self.isHover and not self.isPressed:
+            bottomBorderColor = self._lightHoverBottomBorderColor
 
         if self.selected:
+            tracing_color = self._darkTracingColor if isDark else self._lightTracingColor
             # Draw rounded rectangle with film
-            painter.setBrush(film_color) # Translucent film
+            painter.setBrush(self._filmColor) # Translucent film
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(self.rect(), r, r)
 
             # Draw tracing (inner border)
-            path.addRoundedRect(4, 4, w - 8, h - 8, r-2, r-2) # More inset and slightly smaller radius
-            painter.strokePath(path, QPen(tracing_color, 6, Qt.DashLine)) # Dashed line
+            self._tracePen.setColor(tracing_color)
+            painter.strokePath(self._tracePath, self._tracePen) # Dashed line
+            painter.strokePath(self._tracePath, bottomBorderColor)
         else:
-            # Draw background and border
-            if isDark:
-                if self.isPressed:
-                    topBorderColor = QColor(255, 255, 255, 18)
-                elif self.isHover:
-                    topBorderColor = QColor(255, 255, 255, 13)
-            else:
-                if self.selected:
-                    topBorderColor = QColor(50, 180, 165, 230)
-                else:
-                    if self.cluster_color:  # Use cluster color if available
-                        topBorderColor = QColor(self.cluster_color)
-                    else:
-                        topBorderColor = QColor(240, 240, 240, 60)
-
-            painter.strokePath(path, topBorderColor)
-        
-            pen = QPen(topBorderColor)
-            pen.setWidth(6)
-            painter.setPen(pen)
-            rect = self.rect().adjusted(1, 1, -1, -1)
-            painter.setBrush(self.backgroundColor)
-            painter.drawRoundedRect(rect, r, r)
-
-            # Draw top border
-            path = QPainterPath()
-            path.arcMoveTo(1, h - d - 1, d, d, 240)
-            path.arcTo(1, h - d - 1, d, d, 225, -60)
-            path.lineTo(1, r)
-            path.arcTo(1, 1, d, d, -180, -90)
-            path.lineTo(w - r, 1)
-            path.arcTo(w - d - 1, 1, d, d, 90, -90)
-            path.lineTo(w - 1, h - r)
-            path.arcTo(w - d - 1, h - d - 1, d, d, 0, -60)
-
-        # Draw bottom border
-        bottomBorderColor = topBorderColor
-        if not isDark and self.isHover and not self.isPressed:
-            bottomBorderColor = QColor(0, 0, 0, 27)
+            # Draw background and border from the cached pixmap, re-rendered only when its colors change
+            key = (topBorderColor.rgba(), bottomBorderColor.rgba(), self.backgroundColor.rgba(),
+                   self.devicePixelRatioF())
+            if self._bgPixmap is None or key != self._bgKey:
+                self._bgPixmap = self._renderBackground(topBorderColor, bottomBorderColor)
+                self._bgKey = key
+            painter.drawPixmap(0, 0, self._bgPixmap)
+
+    def _renderBackground(self, topBorderColor, bottomBorderColor):
+        """Paints the unselected background and borders into a pixmap of the card size."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        r = self._borderRadius
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.Antialiasing)
+        self._borderPen.setColor(topBorderColor)
+        painter.setPen(self._borderPen)
+        painter.setBrush(self.backgroundColor)
+        painter.drawRoundedRect(self._bgRect, r, r)
 
-        painter.strokePath(path, bottomBorderColor)
+        # Draw top border
+        painter.strokePath(self._topPath, bottomBorderColor)
+        painter.end()
+        return pixmap
 
     def mousePressEvent(self, event: QMouseEvent):
         """Store the position where the mouse is pressed."""
@@ -150,9 +214,12 @@ class ClustersCard(CardWidget):
         drag.setMimeData(mime_data)
 
         # Optional: Set drag pixmap for better UX
-        pixmap = self.grab()
-        drag.setPixmap(pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        drag.setHotSpot(pixmap.rect().center())
+        key = (self.cluster_color, self.selected, isDarkTheme(), self.label.text())  # the label changes on reindex
+        if self._dragPixmap is None or key != self._dragPixmapKey:
+            self._dragPixmap = self.grab().scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self._dragPixmapKey = key
+        drag.setPixmap(self._dragPixmap)
+        drag.setHotSpot(self._dragPixmap.rect().center())
 
         drop_action = drag.exec(Qt.MoveAction)
         if drop_action == Qt.MoveAction:
@@ -160,34 +227,31 @@ class ClustersCard(CardWidget):
 
     def dragEnterEvent(self, event):
         """Accept the drag if it contains a cluster ID and is not the same as this cluster."""
-        if event.mimeData().hasText():
-            source_cluster_id = event.mimeData().text()
-            if self.cluster_id != source_cluster_id:
-                event.acceptProposedAction()
-                self.set_selected(True)  # Highlight as valid drop target
-            else:
-                # Do not accept drag from self to prevent self-merging
-                event.ignore()
+        mime_data = event.mimeData()
+        self._dragSourceId = mime_data.text() if mime_data.hasText() else None
+        # Do not accept drag from self to prevent self-merging
+        self._dragAccepted = self._dragSourceId is not None and self._dragSourceId != self.cluster_id
+        if self._dragAccepted:
+            event.acceptProposedAction()
+            self.set_selected(True)  # Highlight as valid drop target
         else:
             event.ignore()
 
     def dragMoveEvent(self, event):
-        """Handle the drag moving over the widget."""
-        if event.mimeData().hasText():
-            source_cluster_id = event.mimeData().text()
-            if self.cluster_id != source_cluster_id:
-                event.acceptProposedAction()
-            else:
-                event.ignore()
+        """Handle the drag moving over the widget, using the source read on drag enter."""
+        if self._dragAccepted:
+            event.acceptProposedAction()
         else:
             event.ignore()
 
     def dropEvent(self, event):
         """Handle the drop event to merge clusters."""
-        source_cluster_id = event.mimeData().text()
+        source_cluster_id = self._dragSourceId
+        self._dragSourceId = None
+        self._dragAccepted = False
         target_cluster_id = self.cluster_id
         logging.debug(f"Drop detected: source={source_cluster_id}, target={target_cluster_id}")
-        if source_cluster_id != target_cluster_id:
+        if source_cluster_id is not None and source_cluster_id != target_cluster_id:
             logging.debug(f"Merging Cluster {source_cluster_id} into Cluster {target_cluster_id}.")
             self.merge_requested.emit([source_cluster_id, target_cluster_id])  # Emit the signal with both IDs
             event.acceptProposedAction()
@@ -198,11 +262,15 @@ class ClustersCard(CardWidget):
 
     def dragLeaveEvent(self, event):
         """Handle the drag leaving the widget."""
+        self._dragSourceId = None
+        self._dragAccepted = False
         self.set_selected(False)
         super().dragLeaveEvent(event)
 
     def set_selected(self, selected: bool):
         """Set the selection state for visual feedback."""
+        if self.selected == selected:
+            return
         self.selected = selected
         self.update()
 
@@ -1,12 +1,94 @@
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QSpacerItem, QSizePolicy, QLabel, QGroupBox, QFrame, QGraphicsDropShadowEffect
+    QWidget, QVBoxLayout, QHBoxLayout, QSpacerItem, QSizePolicy, QLabel, QGroupBox, QFrame
 )
 from backend.config import CLUSTERING_N_ITER, CLUSTERING_DEFAULT_N_CLUSTERS, MODELS
 from qfluentwidgets import Slider, PrimaryPushButton, ComboBox
 
 
+# Fluent widgets install their own stylesheets, so these overrides are set per
+# widget rather than in app.qss; shared constants keep one string per look.
+_COMBO_QSS = """
+    QComboBox {
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 13px;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left-width: 1px;
+        border-left-color: #cccccc;
+        border-left-style: solid;
+        border-top-right-radius: 5px;
+        border-bottom-right-radius: 5px;
+    }
+    QComboBox::down-arrow {
+        image: url(:/icons/down_arrow.png); /* Replace with your arrow icon path */
+    }
+"""
+
+_SLIDER_QSS = """
+    QSlider::handle:horizontal {
+        background-color: #0078d4;
+        border: 1px solid #5c5c5c;
+        width: 14px;
+        height: 14px;
+        margin: -6px 0;
+        border-radius: 7px;
+    }
+    QSlider::groove:horizontal {
+        background-color: #e0e0e0;
+        height: 3px;
+        border-radius: 1.5px;
+    }
+    QSlider::sub-page:horizontal {
+        background-color: #0078d4;
+        height: 3px;
+        border-radius: 1.5px;
+    }
+    QSlider::add-page:horizontal {
+        background-color: #e0e0e0;
+        height: 3px;
+        border-radius: 1.5px;
+    }
+    QSlider::tick-mark {
+        background-color: #000000;
+        width: 2px;
+        height: 3px;
+    }
+"""
+
+_START_BUTTON_QSS = """
+    QPushButton {
+        background-color: #009faa;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #14939c;
+    }
+"""
+
+_RESET_BUTTON_QSS = """
+    QPushButton {
+        background-color: #e0e0e0;
+        color: #333333;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #c0c0c0;
+    }
+"""
+
+
 class ControlPanel(QWidget):
     """Control panel for adjusting clustering parameters."""
 
@@ -17,35 +99,16 @@ class ControlPanel(QWidget):
         # Main Frame with Slightly Rounded Corners and Subtle Shadow
         self.main_frame = QFrame(self)
         self.main_frame.setObjectName("controlPanelFrame")
-        self.main_frame.setStyleSheet("""
-            QFrame#controlPanelFrame {
-                background-color: #ffffff;
-                border-radius: 10px;
-            }
-        """)
-
-        # Apply Subtle Shadow Effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)  # Reduced blur radius for lighter shadow
-        shadow.setXOffset(0)
-        shadow.setYOffset(0)
-        shadow.setColor(QColor(0, 0, 0, 30))  # Less opaque shadow
-        self.main_frame.setGraphicsEffect(shadow)
 
         # Layout for the main frame
         self.vBoxLayout = QVBoxLayout(self.main_frame)
-        self.vBoxLayout.setContentsMargins(15, 15, 15, 15)
+        self.vBoxLayout.setContentsMargins(5, 5, 5, 5)  # 15px from the white edge, the frame border adds 10px
         self.vBoxLayout.setSpacing(10)
 
         # Clustering Label
         self.clustering_label = QLabel("Clustering", self.main_frame)
         self.clustering_label.setAlignment(Qt.AlignCenter)
-        self.clustering_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                color: #333333;
-            }
-        """)
+        self.clustering_label.setObjectName("clusteringTitle")
 
         # Clustering Method Selector
         self.clustering_method_selector = ComboBox(self.main_frame)
@@ -53,164 +116,50 @@ class ControlPanel(QWidget):
             "K-means", "Deep Clustering", "Connected Components"
         ])
         self.clustering_method_selector.setFixedHeight(30)
-        self.clustering_method_selector.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 13px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #cccccc;
-                border-left-style: solid;
-                border-top-right-radius: 5px;
-                border-bottom-right-radius: 5px;
-            }
-            QComboBox::down-arrow {
-                image: url(:/icons/down_arrow.png); /* Replace with your arrow icon path */
-            }
-        """)
+        self.clustering_method_selector.setStyleSheet(_COMBO_QSS)
 
         # K-means Parameters GroupBox
         self.kmeans_params_group = QGroupBox("K-means Parameters", self.main_frame)
-        self.kmeans_params_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 13px;
-                font-weight: normal; /* Removed bold font weight */
-                border: 0.5px solid #e8e8e8;
-                border-radius: 8px;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        self.kmeans_params_group.setObjectName("kmeansParamsGroup")
         kmeans_layout = QVBoxLayout(self.kmeans_params_group)
         kmeans_layout.setContentsMargins(15, 15, 15, 15)
         kmeans_layout.setSpacing(8)
 
         # Iterations Slider and Label
-        self.iterationsLabel = QLabel(f"Iterations: {CLUSTERING_N_ITER}", self.kmeans_params_group)
-        self.iterationsLabel.setFont(QFont("Arial", 11))  # Refined font size
-        self.iterationsLabel.setStyleSheet("color: #555555;")
+        self.iterationsLabel = QLabel("Iterations:", self.kmeans_params_group)
+        self.iterationsValueLabel = QLabel(self.kmeans_params_group)
+        self.iterationsValueLabel.setNum(CLUSTERING_N_ITER)
+        iterations_row = self._valueRow(self.iterationsLabel, self.iterationsValueLabel)
         self.iterationsSlider = Slider(Qt.Horizontal, self.kmeans_params_group)
         self.iterationsSlider.setRange(50, 1000)
         self.iterationsSlider.setValue(CLUSTERING_N_ITER)
         self.iterationsSlider.setSingleStep(50)
         self.iterationsSlider.setFixedHeight(18)
-        self.iterationsSlider.setStyleSheet("""
-            QSlider::handle:horizontal {
-                background-color: #0078d4;
-                border: 1px solid #5c5c5c;
-                width: 14px;
-                height: 14px;
-                margin: -6px 0;
-                border-radius: 7px;
-            }
-            QSlider::groove:horizontal {
-                background-color: #e0e0e0;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::sub-page:horizontal {
-                background-color: #0078d4;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::add-page:horizontal {
-                background-color: #e0e0e0;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::tick-mark {
-                background-color: #000000;
-                width: 2px;
-                height: 3px;
-            }
-        """)
-        self.iterationsSlider.valueChanged.connect(
-            lambda value: self.iterationsLabel.setText(f"Iterations: {value}")
-        )
+        self.iterationsSlider.setStyleSheet(_SLIDER_QSS)
+        self.iterationsSlider.valueChanged.connect(self.iterationsValueLabel.setNum)
 
         # Clusters Slider and Label
-        self.clustersLabel = QLabel(f"Clusters: {CLUSTERING_DEFAULT_N_CLUSTERS}", self.kmeans_params_group)
-        self.clustersLabel.setFont(QFont("Arial", 11))  # Refined font size
-        self.clustersLabel.setStyleSheet("color: #555555;")
+        self.clustersLabel = QLabel("Clusters:", self.kmeans_params_group)
+        self.clustersValueLabel = QLabel(self.kmeans_params_group)
+        self.clustersValueLabel.setNum(CLUSTERING_DEFAULT_N_CLUSTERS)
+        clusters_row = self._valueRow(self.clustersLabel, self.clustersValueLabel)
         self.clustersSlider = Slider(Qt.Horizontal, self.kmeans_params_group)
         self.clustersSlider.setRange(2, 100)
         self.clustersSlider.setValue(CLUSTERING_DEFAULT_N_CLUSTERS)
         self.clustersSlider.setFixedHeight(18)
-        self.clustersSlider.setStyleSheet("""
-            QSlider::handle:horizontal {
-                background-color: #0078d4;
-                border: 1px solid #5c5c5c;
-                width: 14px;
-                height: 14px;
-                margin: -6px 0;
-                border-radius: 7px;
-            }
-            QSlider::groove:horizontal {
-                background-color: #e0e0e0;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::sub-page:horizontal {
-                background-color: #0078d4;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::add-page:horizontal {
-                background-color: #e0e0e0;
-                height: 3px;
-                border-radius: 1.5px;
-            }
-            QSlider::tick-mark {
-                background-color: #000000;
-                width: 2px;
-                height: 3px;
-            }
-        """)
-        self.clustersSlider.valueChanged.connect(
-            lambda value: self.clustersLabel.setText(f"Clusters: {value}")
-        )
+        self.clustersSlider.setStyleSheet(_SLIDER_QSS)
+        self.clustersSlider.valueChanged.connect(self.clustersValueLabel.setNum)
 
         # Feature Extractor Model Selector
         self.model_label = QLabel("Feature Extractor Model:", self.kmeans_params_group)
         self.model_label.setFont(QFont("Arial", 11))  # Refined font size
-        self.model_label.setStyleSheet("color: #555555;")
+        self.model_label.setObjectName("kmeansParamLabel")
         self.kmeans_model_selector = ComboBox(self.kmeans_params_group)
         self.kmeans_model_selector.setFixedHeight(28)
-        self.kmeans_model_selector.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 13px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #cccccc;
-                border-left-style: solid;
-                border-top-right-radius: 5px;
-                border-bottom-right-radius: 5px;
-            }
-            QComboBox::down-arrow {
-                image: url(:/icons/down_arrow.png); /* Replace with your arrow icon path */
-            }
-        """)
+        self.kmeans_model_selector.setStyleSheet(_COMBO_QSS)
 
         # Populate K-means model selector
-        for model_name in MODELS:
-            self.kmeans_model_selector.addItem(model_name)
+        self.kmeans_model_selector.addItems(list(MODELS))
 
         # Load default model from parent settings, if available
         if self.parent_widget and hasattr(self.parent_widget, 'main_window'):
@@ -218,9 +167,9 @@ class ControlPanel(QWidget):
             self.kmeans_model_selector.setCurrentText(settings.get("model", MODELS[0]))
 
         # Add widgets to K-means layout
-        kmeans_layout.addWidget(self.iterationsLabel, alignment=Qt.AlignHCenter)
+        kmeans_layout.addLayout(iterations_row)
         kmeans_layout.addWidget(self.iterationsSlider)
-        kmeans_layout.addWidget(self.clustersLabel, alignment=Qt.AlignHCenter)
+        kmeans_layout.addLayout(clusters_row)
         kmeans_layout.addWidget(self.clustersSlider)
         kmeans_layout.addWidget(self.model_label, alignment=Qt.AlignHCenter)
         kmeans_layout.addWidget(self.kmeans_model_selector)
@@ -232,30 +181,8 @@ class ControlPanel(QWidget):
         self.resetButton.setFixedHeight(35)
 
         # Style Buttons
-        self.startButton.setStyleSheet("""
-            QPushButton {
-                background-color: #009faa;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #14939c;
-            }
-        """)
-        self.resetButton.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333333;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #c0c0c0;
-            }
-        """)
+        self.startButton.setStyleSheet(_START_BUTTON_QSS)
+        self.resetButton.setStyleSheet(_RESET_BUTTON_QSS)
 
         # Spacer for layout
         self.spacer = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding)
@@ -278,12 +205,25 @@ class ControlPanel(QWidget):
         # Set the main layout to include the frame
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self.main_frame)
-        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setContentsMargins(0, 0, 0, 0)  # the frame border image draws its 10px shadow here
         self.setLayout(main_layout)
 
         # Set own width
         self.setFixedWidth(280)
 
+    @staticmethod
+    def _valueRow(name_label, value_label):
+        """Centers a fixed name label and a numeric value label, updated with setNum, on one row."""
+        row = QHBoxLayout()
+        row.setSpacing(4)
+        row.addStretch(1)
+        for label in (name_label, value_label):
+            label.setFont(QFont("Arial", 11))  # Refined font size
+            label.setObjectName("kmeansParamLabel")
+            row.addWidget(label)
+        row.addStretch(1)
+        return row
+
     def update_parameter_visibility(self, index):
         """Show or hide parameter controls based on selected clustering method."""
         method = self.clustering_method_selector.itemText(index)
@@ -13,6 +13,7 @@ class ClustersViewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.clusters = []  # List to store ClustersCard objects
+        self._cards_by_id = {}  # cluster_id -> ClustersCard
         self.hBoxLayout = QHBoxLayout(self)
         self.controlPanel = ControlPanel(self)
         self.clustersGallery = FlowGallery(self)
@@ -40,9 +41,22 @@ class ClustersViewWidget(QWidget):
         card.cluster_id = cluster_id
         card.label.setText(str(display_index))  # Set the shortened ID as the card label
         self.clusters.append(card)
+        self._cards_by_id[cluster_id] = card
         self.clustersGallery.flow_layout.addWidget(card)
         return card
 
+    def begin_batch(self):
+        """Suspends gallery repaints while many cards are added or removed. Layout animation stays on, so added cards get their flowAni."""
+        self.clustersGallery.begin_batch()
+
+    def end_batch(self):
+        """Ends a batch started by begin_batch() with a single gallery relayout."""
+        self.clustersGallery.end_batch()
+
+    def get_cluster_card(self, cluster_id):
+        """Returns the ClustersCard for the given cluster ID, or None."""
+        return self._cards_by_id.get(cluster_id)
+
     def clear_cluster_cards(self, cluster_ids = None):
         """
         Clears cluster cards from the gallery.
@@ -50,41 +64,43 @@ class ClustersViewWidget(QWidget):
         Args:
             cluster_ids: List of cluster IDs to clear. If None, all clusters are cleared.
         """
-        if not cluster_ids: # Clear all clusters
-            for i in reversed(range(self.clustersGallery.flow_layout.count())):
-                item = self.clustersGallery.flow_layout.takeAt(i)  # Remove the layout item
-                item.deleteLater()
-            for card in self.clusters:
-                card.deleteLater()
-            self.clusters = []  # Clear the list of cards
-            self.cluster_index_map.clear()
-        else: # Clear specific clusters
-            for cluster_id in cluster_ids:
+        self.begin_batch()
+        try:
+            if not cluster_ids: # Clear all clusters
+                for i in reversed(range(self.clustersGallery.flow_layout.count())):
+                    item = self.clustersGallery.flow_layout.takeAt(i)  # Remove the layout item
+                    item.deleteLater()
                 for card in self.clusters:
-                    if card.cluster_id == cluster_id:
+                    card.deleteLater()
+                self.clusters = []  # Clear the list of cards
+                self._cards_by_id.clear()
+                self.cluster_index_map.clear()
+            else: # Clear specific clusters
+                id_set = set(cluster_ids)
+                for cluster_id in id_set:
+                    card = self._cards_by_id.pop(cluster_id, None)
+                    if card is not None:
                         self.clustersGallery.flow_layout.removeWidget(card)
                         card.deleteLater()
-                        self.clusters.remove(card)
-                    if cluster_id in self.cluster_index_map:
-                        del self.cluster_index_map[cluster_id]
-            self._reindex_clusters()
+                    self.cluster_index_map.pop(cluster_id, None)
+                self.clusters = [card for card in self.clusters if card.cluster_id not in id_set]
+                self._reindex_clusters()
+        finally:
+            self.end_batch()
 
     def _reindex_clusters(self):
         """Reassigns display indices to clusters."""
-        new_index_map = {}
-        current_index = 1
-        for cluster_id in self.clusters_presenter.data_manager.clusters:  # Use data_manager to get the actual clusters
-            new_index_map[cluster_id] = current_index
-            current_index += 1
-
-        self.cluster_index_map = new_index_map
-
-        # Update card labels to reflect the new indices
-        for card in self.clusters:
-            display_index = self.cluster_index_map.get(card.cluster_id)
-            if display_index is not None:  # Only update if the cluster still exists
+        # Use data_manager to get the actual clusters
+        self.cluster_index_map = {
+            cluster_id: display_index
+            for display_index, cluster_id in enumerate(self.clusters_presenter.data_manager.clusters, start=1)
+        }
+
+        # Update card labels to reflect the new indices; setText repaints only the label
+        for cluster_id, display_index in self.cluster_index_map.items():
+            card = self._cards_by_id.get(cluster_id)
+            if card is not None:  # Only update clusters that have a card
                 card.label.setText(str(display_index))
-                card.update() #force refresh
 
     def set_presenter(self, presenter):
         """Sets the ClustersPresenter for this widget."""
@@ -93,8 +109,13 @@ class ClustersViewWidget(QWidget):
     def clear_clusters(self) -> None:
         """Clears all cluster cards from the gallery."""
         logging.info("Clearing all cluster cards from ClustersViewWidget.")
-        for card in self.clusters:
-            self.clustersGallery.flow_layout.removeWidget(card)
-            card.deleteLater()
+        self.begin_batch()
+        try:
+            for card in self.clusters:
+                self.clustersGallery.flow_layout.removeWidget(card)
+                card.deleteLater()
+        finally:
+            self.end_batch()
         self.clusters.clear()
+        self._cards_by_id.clear()
         logging.info("All cluster cards cleared from ClustersViewWidget.")
\ No newline at end of file
@@ -4,7 +4,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QListView
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QFrame, QGraphicsDropShadowEffect, QSizePolicy
+    QWidget, QVBoxLayout, QFrame, QSizePolicy
 )
 from UI.navigation_interface.workspace.views.gallery.gallery_delegate import GalleryDelegate
 from backend.presenters.gallery_model import GalleryModel
@@ -32,12 +32,18 @@ class GalleryView(QListView):
         self.delegate = GalleryDelegate(self)
         self.setItemDelegate(self.delegate)
 
+        # Set by GalleryViewWidget.set_presenter
+        self.context_menu_handler = None
+
         # Configure the view
         self.setViewMode(QListView.IconMode)
         self.setFlow(QListView.LeftToRight)
         self.setResizeMode(QListView.Adjust)
         self.setSpacing(10)
-        self.setUniformItemSizes(False)
+        # All cards share the delegate's card size, so layout can be computed arithmetically
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
         self.setSelectionMode(QListView.ExtendedSelection)
         self.setMovement(QListView.Static)
         self.setWrapping(True)
@@ -55,13 +61,8 @@ class GalleryView(QListView):
         # Optional: Set minimum size
         self.setMinimumSize(200, 200)
 
-        # Remove default border and set transparent background
-        self.setStyleSheet("""
-            QListView {
-                border: none;
-                background-color: transparent;
-            }
-        """)
+        # Remove default border and set transparent background (styled in app.qss)
+        self.setObjectName("galleryView")
 
         # Optional: Adjust the palette to ensure transparency
         palette = self.palette()
@@ -71,12 +72,9 @@ class GalleryView(QListView):
 
     def contextMenuEvent(self, event):
         index = self.indexAt(event.pos())
-        if index.isValid():
+        if index.isValid() and self.context_menu_handler is not None:
             image = index.data(Qt.UserRole)  # Retrieve the Image object
-            # Access the context menu handler from the presenter
-            print(self.parent())
-            context_menu_handler = self.parent().parent().parent().gallery_presenter.context_menu_handler # accessing main_frame -> gallery_container -> gallery_view_widget -> gallery_presenter
-            context_menu_handler.show_context_menu(image, event)
+            self.context_menu_handler.show_context_menu(image, event)
         else:
             # Optionally handle context menu for empty space
             pass
@@ -91,24 +89,10 @@ class GalleryContainer(QWidget):
         # Create the main frame
         self.main_frame = QFrame(self)
         self.main_frame.setObjectName("galleryContainerFrame")
-        self.main_frame.setStyleSheet("""
-            QFrame#galleryContainerFrame {
-                background-color: #ffffff;
-                border-radius: 10px;
-            }
-        """)
-
-        # Apply a subtle shadow effect to the frame
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)  # Controls the blur radius of the shadow
-        shadow.setXOffset(0)      # Horizontal offset
-        shadow.setYOffset(0)      # Vertical offset
-        shadow.setColor(QColor(0, 0, 0, 20))  # Shadow color with transparency
-        self.main_frame.setGraphicsEffect(shadow)
 
         # Set up the layout for the frame
         frame_layout = QVBoxLayout(self.main_frame)
-        frame_layout.setContentsMargins(15, 15, 15, 15)  # Inner margins
+        frame_layout.setContentsMargins(5, 5, 5, 5)  # Inner margins, 15px from the white edge with the frame border
         frame_layout.setSpacing(10)  # Space between widgets inside the frame
 
         # Initialize the GalleryView
@@ -123,7 +107,7 @@ class GalleryContainer(QWidget):
         # Set up the main layout for the container
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self.main_frame)
-        main_layout.setContentsMargins(10, 10, 10, 10)  # Outer margins
+        main_layout.setContentsMargins(0, 0, 0, 0)  # Outer margins, taken by the frame border image's 10px shadow
         self.setLayout(main_layout)
 
         # Optionally, set a minimum size to prevent squishing
@@ -1,8 +1,7 @@
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, QLabel,
-    QFrame, QGraphicsDropShadowEffect
+    QFrame
 )
 from qfluentwidgets import FluentIcon as FIF, Slider, ComboBox, TogglePushButton, ToggleToolButton
 
@@ -15,24 +14,10 @@ class GalleryControls(QWidget):
         # Main Frame with Slightly Rounded Corners and Subtle Shadow
         self.main_frame = QFrame(self)
         self.main_frame.setObjectName("galleryControlsFrame")
-        self.main_frame.setStyleSheet("""
-            QFrame#galleryControlsFrame {
-                background-color: #ffffff;
-                border-radius: 10px;
-            }
-        """)
-
-        # Apply Subtle Shadow Effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)  # Adjusted blur radius for subtlety
-        shadow.setXOffset(0)
-        shadow.setYOffset(0)
-        shadow.setColor(QColor(0, 0, 0, 20))  # More transparent shadow
-        self.main_frame.setGraphicsEffect(shadow)
 
         # Layout for the main frame
         main_layout = QHBoxLayout(self.main_frame)
-        main_layout.setContentsMargins(10, 15, 10, 15)  # Increased top and bottom margins
+        main_layout.setContentsMargins(0, 5, 0, 5)  # 10px/15px from the white edge, the frame border adds 10px
         main_layout.setSpacing(40)  # Increased spacing between sections
 
         # ================== Left Section: Scale Label and Slider ==================
@@ -40,7 +25,7 @@ class GalleryControls(QWidget):
         left_layout.setAlignment(Qt.AlignTop)
 
         self.scaleLabel = QLabel("Scale", self.main_frame)
-        self.scaleLabel.setStyleSheet("font-size: 14pt;")
+        self.scaleLabel.setObjectName("galleryControlsLabel")
         self.scaleLabel.setAlignment(Qt.AlignCenter)
 
         self.scale_slider = Slider(Qt.Horizontal, self.main_frame)
@@ -59,7 +44,7 @@ class GalleryControls(QWidget):
         middle_layout.setAlignment(Qt.AlignTop)
 
         self.sortOrderLabel = QLabel("Sorting parameters", self.main_frame)
-        self.sortOrderLabel.setStyleSheet("font-size: 14pt;")
+        self.sortOrderLabel.setObjectName("galleryControlsLabel")
         self.sortOrderLabel.setAlignment(Qt.AlignCenter)
 
         sort_controls_layout = QHBoxLayout()
@@ -118,13 +103,10 @@ class GalleryControls(QWidget):
         main_layout.addLayout(middle_layout)
         main_layout.addLayout(right_layout)
 
-        # ================== Connect Signals ==================
-        self.scale_slider.valueChanged.connect(lambda value: print(f"Scale: {value}"))
-
         # ================== Set the Main Layout ==================
         outer_layout = QHBoxLayout(self)
         outer_layout.addWidget(self.main_frame)
-        outer_layout.setContentsMargins(10, 10, 10, 10)
+        outer_layout.setContentsMargins(0, 0, 0, 0)  # the frame border image draws its 10px shadow here
         self.setLayout(outer_layout)
 
         # self.main_frame.setFixedHeight(120)  # Set fixed height for the main frame
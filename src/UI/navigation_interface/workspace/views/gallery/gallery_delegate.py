@@ -1,9 +1,13 @@
 # backend/delegates/gallery_delegate.py
 
+from collections import OrderedDict
+
 from PySide6.QtCore import QRect, QSize, Qt
-from PySide6.QtGui import QPainter, QColor, QPixmap, QPen, QBrush, QPainterPath
+from PySide6.QtGui import QPainter, QColor, QPixmap, QPen, QBrush
 from PySide6.QtWidgets import QStyledItemDelegate, QStyle
 
+from backend.config import GALLERY_SCALED_PIXMAP_CACHE_SIZE
+
 
 class GalleryDelegate(QStyledItemDelegate):
     """
@@ -30,6 +34,22 @@ class GalleryDelegate(QStyledItemDelegate):
         self.error_pen = QPen(QColor("#FF0000"))         # Red pen for errors
         self.text_pen = QPen(QColor("#000000"))          # Black pen for text
 
+        # Smoothly scaled card images, keyed by (source pixmap cacheKey, width, height)
+        self._scaled_cache = OrderedDict()
+
+    def _scaled_pixmap(self, pixmap, width, height):
+        """Returns pixmap scaled into width x height, reusing the result of earlier repaints."""
+        key = (pixmap.cacheKey(), width, height)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(key)
+            return scaled
+        scaled = pixmap.scaled(QSize(width, height), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._scaled_cache[key] = scaled
+        if len(self._scaled_cache) > GALLERY_SCALED_PIXMAP_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)  # Remove least recently drawn
+        return scaled
+
     def set_card_size(self, new_size: QSize):
         """
         Sets a new size for the gallery card and triggers a repaint.
@@ -69,15 +89,11 @@ class GalleryDelegate(QStyledItemDelegate):
         text_height = 25
         badge_radius = 8
 
-        # Draw background with rounded corners
+        # The card background is the gallery frame's, only hover and selection are drawn per item.
+        # Everything below stays inside the rounded rect, so no clip path is needed.
         painter.setRenderHint(QPainter.Antialiasing)
         radius = 10  # Adjust the radius as needed
 
-        path = QPainterPath()
-        path.addRoundedRect(rect, radius, radius)
-        painter.setClipPath(path)
-        painter.fillPath(path, painter.brush())
-
         if option.state & QStyle.State_MouseOver:
             painter.setBrush(QColor("#E0F7FA"))  # Light cyan background on hover
             painter.drawRoundedRect(rect, radius, radius)
@@ -95,11 +111,7 @@ class GalleryDelegate(QStyledItemDelegate):
         # Draw pixmap (image or mask)
         if isinstance(pixmap, QPixmap) and not pixmap.isNull():
             # Scale pixmap based on available image area, maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                QSize(image_area_width, image_area_height),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            scaled_pixmap = self._scaled_pixmap(pixmap, image_area_width, image_area_height)
 
             # Calculate position to center the image
             offset_x = (image_area_width - scaled_pixmap.width()) / 2
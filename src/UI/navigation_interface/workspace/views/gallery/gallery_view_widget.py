@@ -27,8 +27,15 @@ class GalleryViewWidget(QWidget):
         self.sorting_order = "Ascending"
         self.sorting_parameter = "Area"
 
+        # Coalesces slider ticks during a drag into one relayout
+        self._pending_scale = self.controls.scale_slider.value()
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(30)
+        self._scale_timer.timeout.connect(lambda: self.resize_tiles(self._pending_scale))
+
         # Connect signals
-        self.controls.scale_slider.valueChanged.connect(self.resize_tiles)
+        self.controls.scale_slider.valueChanged.connect(self._schedule_resize)
         self.resize_tiles(self.controls.scale_slider.value())  # Set initial tile size
         self.controls.sortAscButton.toggled.connect(self.updateSortingOrder)
         self.controls.sortDescButton.toggled.connect(self.updateSortingOrder)
@@ -36,6 +43,7 @@ class GalleryViewWidget(QWidget):
 
     def set_presenter(self, gallery_presenter):
         self.gallery_presenter = gallery_presenter
+        self.gallery_container.gallery_view.context_menu_handler = gallery_presenter.context_menu_handler
 
     def handle_gallery_mouse_press(self, event):
         """Handles mouse press events on the gallery."""
@@ -80,6 +88,11 @@ class GalleryViewWidget(QWidget):
         print(f"Sorting parameter changed to: {parameter}")
         self.gallery_presenter.sort_gallery()
 
+    def _schedule_resize(self, new_size):
+        """Remembers the latest slider value and restarts the resize debounce timer."""
+        self._pending_scale = new_size
+        self._scale_timer.start()
+
     def resize_tiles(self, new_size):
         """Resizes the gallery tiles based on the slider value."""
         new_width = 100 * new_size / 100  # Scale the width based on the slider value
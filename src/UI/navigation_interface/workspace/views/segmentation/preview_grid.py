@@ -1,10 +1,6 @@
 import cv2
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import (
-    QGraphicsDropShadowEffect
-)
 from PySide6.QtWidgets import (
     QGridLayout,
     QLabel,
@@ -22,29 +18,24 @@ class PreviewGrid(QFrame):
         # Set object name for styling
         self.setObjectName("previewGridFrame")
         
-        # Style the frame with rounded corners and background color
+        # Style the frame with rounded corners, background color and the shadow_frame.png shadow
         self.setStyleSheet("""
             QFrame#previewGridFrame {
                 background-color: #ffffff;
+                background-clip: padding;
                 border-radius: 10px;
+                border-width: 20px;
+                border-image: url(resource:shadow_frame.png) 20 20 20 20 stretch stretch;
             }
         """)
         
-        # Apply a subtle shadow effect to the frame
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)  # Controls the softness of the shadow
-        shadow.setXOffset(0)      # Horizontal offset
-        shadow.setYOffset(0)      # Vertical offset
-        shadow.setColor(QColor(0, 0, 0, 30))  # Shadow color with transparency
-        self.setGraphicsEffect(shadow)
-        
         # Set size policy to allow expansion
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         
         # Set up the grid layout
         self.layout = QGridLayout(self)
         self.layout.setSpacing(15)
-        self.layout.setContentsMargins(20, 20, 20, 20)
+        self.layout.setContentsMargins(10, 10, 10, 10)  # 20px from the white edge, the frame border adds 10px
         self.preview_widgets = []
         
         # Create a 2x4 grid of preview images
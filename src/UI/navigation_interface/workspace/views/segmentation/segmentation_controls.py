@@ -1,13 +1,11 @@
 # frontend/views/segmentation_controls.py
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QFrame,
     QVBoxLayout,
     QLabel,
-    QSizePolicy,
-    QGraphicsDropShadowEffect
+    QSizePolicy
 )
 from qfluentwidgets import ComboBox, Slider, PushButton
 
@@ -21,26 +19,21 @@ class SegmentationControls(QFrame):
         # Set object name for styling
         self.setObjectName("segmentationControlsFrame")
         
-        # Style the frame with rounded corners and background color
+        # Style the frame with rounded corners, background color and the shadow_frame.png shadow
         self.setStyleSheet("""
             QFrame#segmentationControlsFrame {
                 background-color: #ffffff;
+                background-clip: padding;
                 border-radius: 10px;
+                border-width: 20px;
+                border-image: url(resource:shadow_frame.png) 20 20 20 20 stretch stretch;
             }
         """)
         
-        # Apply a subtle shadow effect to the frame
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)  # Controls the softness of the shadow
-        shadow.setXOffset(0)      # Horizontal offset
-        shadow.setYOffset(0)      # Vertical offset
-        shadow.setColor(QColor(0, 0, 0, 30))  # Shadow color with transparency
-        self.setGraphicsEffect(shadow)
-        
         # Set size policy to be fixed
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.setFixedWidth(300)
-        self.setFixedHeight(335)
+        self.setFixedWidth(320)  # 300x335 white body plus the 10px shadow of the frame border on each side
+        self.setFixedHeight(355)
 
         # Initialize widgets
         self.method_label = QLabel("Base segmentation method:")
@@ -75,7 +68,7 @@ class SegmentationControls(QFrame):
 
         # Main layout for controls
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setContentsMargins(10, 10, 10, 10)  # 20px from the white edge, the frame border adds 10px
         layout.setSpacing(10)
 
         # Add widgets to the layout
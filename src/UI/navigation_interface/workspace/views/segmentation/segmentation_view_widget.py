@@ -23,8 +23,8 @@ class SegmentationViewWidget(QWidget):
         # Horizontal layout for controls and preview (scaled)
         content_layout = QHBoxLayout()
         content_layout.setAlignment(Qt.AlignCenter)
-        content_layout.setContentsMargins(20, 20, 20, 20)
-        content_layout.setSpacing(20)
+        content_layout.setContentsMargins(10, 10, 10, 10)  # the panels' border images draw their 10px shadow inside these
+        content_layout.setSpacing(0)
 
         # Create wrapper layouts to control vertical alignment
         left_wrapper = QVBoxLayout()
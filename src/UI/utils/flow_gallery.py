@@ -1,8 +1,7 @@
 # flow_widget.py
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
-    QScrollArea, QWidget, QFrame, QGraphicsDropShadowEffect, QVBoxLayout
+    QScrollArea, QWidget, QFrame, QVBoxLayout
 )
 from qfluentwidgets import FlowLayout
 
@@ -14,11 +13,14 @@ class FlowGallery(QFrame):
         # Set object name for styling
         self.setObjectName("FlowGalleryFrame")
 
-        # Apply rounded corners and a subtle shadow
+        # Apply rounded corners and a subtle shadow (the shadow_frame.png border image, as on the app.qss panels)
         self.setStyleSheet("""
             #FlowGalleryFrame {
                 background-color: #ffffff;
+                background-clip: padding;
                 border-radius: 10px;
+                border-width: 20px;
+                border-image: url(resource:shadow_frame.png) 20 20 20 20 stretch stretch;
             }
             /* Scrollbar Styles */
             QScrollBar:vertical {
@@ -47,14 +49,6 @@ class FlowGallery(QFrame):
             }
         """)
 
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setXOffset(0)
-        shadow.setYOffset(0)
-        shadow.setColor(QColor(0, 0, 0, 20))
-        self.setGraphicsEffect(shadow)
-
         # Set up the scrolling area inside the frame
         self.scroll_area = QScrollArea(self)
         self.scroll_area.setObjectName("FlowGalleryScrollArea")
@@ -91,7 +85,7 @@ class FlowGallery(QFrame):
 
         # Layout for the frame
         self.frame_layout = QVBoxLayout(self)
-        self.frame_layout.setContentsMargins(0, 0, 0, 0)  # Inner margins
+        self.frame_layout.setContentsMargins(-10, -10, -10, -10)  # Inner margins, the scroll area reaches the white edge inside the 20px border
         self.frame_layout.setSpacing(0)
         self.frame_layout.addWidget(self.scroll_area)
 
@@ -102,6 +96,8 @@ class FlowGallery(QFrame):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
 
+        self._batch_depth = 0
+
     def add_item(self, widget):
         """Convenience method to add a widget to the flow layout."""
         self.flow_layout.addWidget(widget)
@@ -109,3 +105,29 @@ class FlowGallery(QFrame):
     def remove_item(self, widget):
         """Convenience method to remove a widget from the flow layout."""
         self.flow_layout.removeWidget(widget)
+
+    def begin_batch(self):
+        """
+        Suspends repaints until the matching end_batch(). Calls may nest.
+
+        needAni is left alone: FlowLayout only creates a widget's animation when it is added with
+        needAni on, and its animated relayout expects one animation per item.
+        """
+        if self._batch_depth == 0:
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Ends a batch started by begin_batch(); the outermost call relayouts once."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.setUpdatesEnabled(True)
+            self.flow_layout.update()
+
+    def clear_items(self):
+        """Removes all widgets from the flow layout with a single relayout. The widgets are not deleted."""
+        self.begin_batch()
+        try:
+            self.flow_layout.removeAllWidgets()
+        finally:
+            self.end_batch()
@@ -0,0 +1,76 @@
+import os
+
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+
+def _cacheKey(path: str, height: int) -> str:
+    """The file's modification time is part of the key, so rewritten previews are decoded again."""
+    return f"{path}:{os.path.getmtime(path)}:{height}"
+
+
+class _ThumbnailSignals(QObject):
+    loaded = Signal(str, object)  # cache key, decoded QImage
+
+
+class _ThumbnailTask(QRunnable):
+    """Decodes and scales one preview image on a pool thread."""
+
+    def __init__(self, key, path, height, signals):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.height = height
+        self.signals = signals
+
+    @Slot()
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull() and self.height is not None:
+            image = image.scaledToHeight(self.height, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.key, image)
+
+
+class ThumbnailLoader:
+    """ Hands out preview pixmaps from the process-wide pixmap cache, decoding misses off the GUI thread. """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._signals = _ThumbnailSignals()
+        self._signals.loaded.connect(self._onLoaded)
+        # callbacks waiting for each key that is being decoded
+        self._pending = {}
+
+    def request(self, path: str, height: int, callback):
+        """Calls callback with the image at path scaled to height, right away if it is cached."""
+        try:
+            key = _cacheKey(path, height)
+        except OSError:
+            callback(QPixmap())
+            return
+
+        pix = QPixmap()
+        if QPixmapCache.find(key, pix):
+            callback(pix)
+            return
+
+        callbacks = self._pending.setdefault(key, [])
+        callbacks.append(callback)
+        if len(callbacks) == 1:
+            QThreadPool.globalInstance().start(_ThumbnailTask(key, path, height, self._signals))
+
+    def _onLoaded(self, key, image):
+        pix = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pix)
+        for callback in self._pending.pop(key, []):
+            try:
+                callback(pix)
+            except RuntimeError:  # the card was deleted while its preview was loading
+                pass
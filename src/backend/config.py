@@ -1,4 +1,5 @@
 # backend/config.py
+import functools
 import json
 from pathlib import Path
 import os
@@ -12,17 +13,23 @@ WINDOW_WIDTH = 1250
 WINDOW_HEIGHT = 900
 LIGHT_THEME_QSS_PATH = SRC_ROOT / "UI" / "resource" / "light" / "demo.qss"
 DARK_THEME_QSS_PATH = SRC_ROOT / "UI" / "resource" / "dark" / "demo.qss"
+APP_QSS_PATH = SRC_ROOT / "UI" / "resource" / "app.qss"  # Theme-independent styles applied on the QApplication
 FOLDER_CLOSE_ICON_PATH = ":/qfluentwidgets/images/folder_list_dialog/Close_{c}.png"  # Consider changing this if it's not dynamic
 FOLDER_ADD_ICON_PATH = ":/qfluentwidgets/images/folder_list_dialog/Add_{c}.png"    # Consider changing this if it's not dynamic
 APP_ICON_PATH = SRC_ROOT / "UI" / "resource" / "logo_small-modified.png"
+RESOURCE_ROOT = SRC_ROOT / "UI" / "resource"  # Registered as the "resource:" search path for stylesheet urls
 
 # Card Dimensions (These remain unchanged)
 GALLERY_CARD_WIDTH = 128
 GALLERY_CARD_HEIGHT = 136
 GALLERY_CARD_IMAGE_HEIGHT = 78
+GALLERY_SCALED_PIXMAP_CACHE_SIZE = 512  # Scaled card images kept by GalleryDelegate between repaints
+
+PIXMAP_CACHE_LIMIT = 64 * 1024  # QPixmapCache size for decoded card previews (KB)
 
 CLASS_CARD_WIDTH = 128
 CLASS_CARD_HEIGHT = 136
+CLASS_CARD_IMAGE_HEIGHT = 95
 
 CLUSTERS_CARD_WIDTH = 180
 CLUSTERS_CARD_HEIGHT = 198
@@ -35,6 +42,16 @@ ANALYSIS_CARD_IMAGE_HEIGHT = 302
 # Analysis View Configs (These remain unchanged)
 DEFAULT_HISTOGRAM_BIN_COUNT = 10
 HISTOGRAM_BIN_COUNT_RANGE = (5, 5000)
+# Analysis cards are drawn with Qt Charts, the Plotly HTML is only built for the plot viewer. When False, cards show
+# Plotly's static PNG, or a pooled web view loaded while near the viewport if kaleido cannot write the PNG
+ANALYSIS_NATIVE_CARDS = True
+ANALYSIS_THUMBNAIL_SCALE = 2  # Pixel scale of the static PNG plots shown on Plotly analysis cards
+PLOT_CACHE_SIZE = 32  # Generated plot files remembered by PlotGenerator for identical requests
+ANALYSIS_WEBVIEW_POOL_SIZE = 2  # Idle plot web views kept ready for new analysis cards
+WEBENGINE_HTTP_CACHE_SIZE = 200 * 1024 * 1024  # Shared HTTP disk cache for the plot web views (bytes)
+WEBENGINE_CACHE_DIR = os.path.join(PROJECT_ROOT, "temp", "webengine_cache")
+# Chromium flags for QtWebEngine on Windows, set before the QApplication is created
+WEBENGINE_WINDOWS_CHROMIUM_FLAGS = "--disable-gpu-compositing --enable-gpu-rasterization --ignore-gpu-blocklist"
 
 # Chart Fonts (These remain unchanged)
 CHART_TITLE_FONT = dict(family="Arial", size=20, weight="bold")
@@ -86,17 +103,23 @@ DEFAULT_SETTINGS = {
 SETTINGS_FILE = PROJECT_ROOT.parent / "settings.json"
 SESSIONS_INDEX_FILE = PROJECT_ROOT.parent / "sessions_index.json"
 
-def load_settings():
-    """Loads settings from a file (or uses defaults if the file doesn't exist)."""
+@functools.lru_cache(maxsize=1)
+def _read_settings():
+    """Reads and parses the settings file once; the cache is cleared by save_settings()."""
     try:
         with open(SETTINGS_FILE, 'r') as f:
             settings = json.load(f)
     except FileNotFoundError:
-        settings = DEFAULT_SETTINGS
+        settings = dict(DEFAULT_SETTINGS)
         save_settings(settings)  # Save default settings
     return settings
 
+def load_settings():
+    """Loads settings from a file (or uses defaults if the file doesn't exist)."""
+    return dict(_read_settings())  # Copy so callers can edit without touching the cache
+
 def save_settings(settings):
     """Saves settings to a file."""
     with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=4)
\ No newline at end of file
+        json.dump(settings, f, indent=4)
+    _read_settings.cache_clear()
\ No newline at end of file
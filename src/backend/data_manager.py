@@ -67,8 +67,17 @@ class DataManager(QObject):
         self.settings = settings
         self.samples: Dict[str, Sample] = {}
         self.clusters: Dict[str, Cluster] = {}
+        # Cluster shown for each sample, kept in sync by the cluster methods below
+        self._sample_cluster: Dict[str, Cluster] = {}
         self.classes: Dict[str, SampleClass] = {}
         self.masks: Dict[str, Mask] = {}
+        # Mask attributes in columnar form: one float row per mask, one column per attribute
+        self._attr_matrix: np.ndarray = np.empty((0, 0))
+        self._attr_col: Dict[str, int] = {}
+        self._mask_row: Dict[str, int] = {}
+        self._row_mask: List[str] = []
+        # Number of samples without a mask, recounted lazily after samples or masks change
+        self._unmasked_count: Optional[int] = None
         self.features: Dict[str, str] = {}
         self.processor = Processor(model_name=self.settings['model'], execution_provider=self.settings['provider'])
         self.thread_pool = QThreadPool.globalInstance()
@@ -132,6 +141,7 @@ class DataManager(QObject):
                 logging.error(f"JSON decode error: {e}")
             except Exception as e:
                 logging.error(f"Unexpected error loading image object: {e}")
+        self._unmasked_count = None
         self.images_loaded.emit()
         self._update_objects_metadata()
 
@@ -151,6 +161,7 @@ class DataManager(QObject):
         image_id = str(uuid.uuid4())
         image = Sample(id=image_id, path=image_path)
         self.samples[image_id] = image
+        self._unmasked_count = None
         if update_metadata:
             self._update_objects_metadata()
         return image
@@ -323,7 +334,7 @@ class DataManager(QObject):
                 for image_id in image_ids:
                     image = self.samples.get(image_id)
                     if image:
-                        cluster.add_image(image)
+                        self._assign_cluster(image, cluster)
                 self.clusters[cluster.id] = cluster
             except KeyError as e:
                 logging.error(f"Missing key in cluster entry: {e}")
@@ -368,6 +379,38 @@ class DataManager(QObject):
         """
         return self.clusters.get(cluster_id)
 
+    def cluster_of(self, sample_id: str) -> Optional[Cluster]:
+        """
+        Returns the cluster of a sample. A sample in several clusters reports the first one it joined.
+
+        Args:
+            sample_id (str): ID of the sample.
+
+        Returns:
+            Optional[Cluster]: Cluster object if the sample is clustered, else None.
+        """
+        return self._sample_cluster.get(sample_id)
+
+    def _assign_cluster(self, image: Sample, cluster: Cluster) -> None:
+        """
+        Adds an image to a cluster and records it in the sample-to-cluster index.
+        """
+        cluster.add_image(image)
+        self._sample_cluster.setdefault(image.id, cluster)
+
+    def _unassign_cluster(self, image: Sample, cluster: Cluster) -> None:
+        """
+        Removes an image from a cluster, falling back to another cluster of the image in the index.
+        """
+        cluster.remove_image(image)
+        if self._sample_cluster.get(image.id) is cluster:
+            remaining = next((self.clusters[cluster_id] for cluster_id in image.cluster_ids
+                              if cluster_id in self.clusters), None)
+            if remaining:
+                self._sample_cluster[image.id] = remaining
+            else:
+                del self._sample_cluster[image.id]
+
     def add_images_to_cluster(self, image_ids: List[str], cluster_id: str) -> None:
         """
         Adds images to a specified cluster.
@@ -384,7 +427,7 @@ class DataManager(QObject):
         for image_id in image_ids:
             image = self.samples.get(image_id)
             if image:
-                cluster.add_image(image)
+                self._assign_cluster(image, cluster)
             else:
                 logging.warning(f"Image ID {image_id} does not exist.")
 
@@ -406,7 +449,7 @@ class DataManager(QObject):
         for image_id in image_ids:
             image = self.samples.get(image_id)
             if image:
-                cluster.remove_image(image)
+                self._unassign_cluster(image, cluster)
             else:
                 logging.warning(f"Image ID {image_id} does not exist.")
 
@@ -423,7 +466,7 @@ class DataManager(QObject):
         if cluster:
             # Remove cluster reference from images
             for image in cluster.samples.copy():
-                image.remove_cluster(cluster)
+                self._unassign_cluster(image, cluster)
             logging.info(f"Cluster {cluster_id} deleted successfully.")
         else:
             logging.warning(f"Cluster ID {cluster_id} does not exist.")
@@ -652,6 +695,7 @@ class DataManager(QObject):
                 logging.error(f"JSON decode error in masks: {e}")
             except Exception as e:
                 logging.error(f"Unexpected error loading mask object: {e}")
+        self._reset_mask_attributes()
         logging.info("Masks loaded successfully.")
 
     def create_mask(
@@ -698,6 +742,9 @@ class DataManager(QObject):
         )
 
         self.masks[mask_id] = mask
+        self._add_mask_attributes(mask)
+        # the caller assigns the mask to its sample right after, so only mark the count stale
+        self._unmasked_count = None
         self.mask_created.emit(mask)
         logging.info(f"Mask created for Image ID {image_id} with Mask ID {mask_id}.")
         return mask
@@ -711,6 +758,8 @@ class DataManager(QObject):
         """
         mask = self.masks.pop(mask_id, None)
         if mask:
+            self._remove_mask_attributes(mask_id)
+            self._unmasked_count = None
             try:
                 if self._validate_path(mask.path):
                     os.remove(mask.path)
@@ -734,6 +783,86 @@ class DataManager(QObject):
         }
         self._save_metadata(MASKS_METADATA_FILE, masks_data)
 
+    def _reset_mask_attributes(self) -> None:
+        """
+        Rebuilds the attribute matrix from all loaded masks.
+        """
+        self._attr_matrix = np.empty((0, 0))
+        self._attr_col = {}
+        self._mask_row = {}
+        self._row_mask = []
+        for mask in self.masks.values():
+            self._add_mask_attributes(mask)
+
+    def _add_mask_attributes(self, mask: Mask) -> None:
+        """
+        Appends a row for the mask to the attribute matrix, growing it as needed.
+        Attributes that are not numeric are stored as NaN.
+        """
+        for name in mask.attributes:
+            if name not in self._attr_col:
+                self._attr_col[name] = len(self._attr_col)
+
+        n_rows = len(self._row_mask)
+        capacity, n_cols = self._attr_matrix.shape
+        if n_rows >= capacity or len(self._attr_col) > n_cols:
+            grown = np.full((max(2 * capacity, n_rows + 1, 16), max(n_cols, len(self._attr_col))), np.nan)
+            grown[:capacity, :n_cols] = self._attr_matrix
+            self._attr_matrix = grown
+
+        row = self._attr_matrix[n_rows]
+        row[:] = np.nan
+        for name, value in mask.attributes.items():
+            try:
+                row[self._attr_col[name]] = float(value)
+            except (TypeError, ValueError):
+                pass
+        self._mask_row[mask.id] = n_rows
+        self._row_mask.append(mask.id)
+
+    def _remove_mask_attributes(self, mask_id: str) -> None:
+        """
+        Removes the mask's row by moving the last row into its place.
+        """
+        row = self._mask_row.pop(mask_id, None)
+        if row is None:
+            return
+        last = len(self._row_mask) - 1
+        last_id = self._row_mask.pop()
+        if row != last:
+            self._attr_matrix[row] = self._attr_matrix[last]
+            self._row_mask[row] = last_id
+            self._mask_row[last_id] = row
+
+    def get_mask_attributes(self, mask_ids: List[str], attributes: List[str]) -> np.ndarray:
+        """
+        Gathers attribute values for several masks at once.
+
+        Args:
+            mask_ids (List[str]): IDs of the masks, one output row each.
+            attributes (List[str]): Attribute names, one output column each.
+
+        Returns:
+            np.ndarray: Array of shape (len(mask_ids), len(attributes)), NaN where a mask or attribute is missing.
+        """
+        rows = np.fromiter((self._mask_row.get(mask_id, -1) for mask_id in mask_ids), dtype=np.intp,
+                           count=len(mask_ids))
+        cols = np.fromiter((self._attr_col.get(name, -1) for name in attributes), dtype=np.intp,
+                           count=len(attributes))
+        values = np.full((len(rows), len(cols)), np.nan)
+        valid_rows, valid_cols = rows >= 0, cols >= 0
+        values[np.ix_(valid_rows, valid_cols)] = self._attr_matrix[np.ix_(rows[valid_rows], cols[valid_cols])]
+        return values
+
+    def samples_without_mask(self) -> int:
+        """
+        Returns the number of samples that have no mask assigned.
+        The count is cached until samples or masks are added or removed.
+        """
+        if self._unmasked_count is None:
+            self._unmasked_count = sum(1 for image in self.samples.values() if image.mask_id is None)
+        return self._unmasked_count
+
     def get_mask(self, mask_id: str) -> Optional[Mask]:
         """
         Returns the Mask object with the given ID.
@@ -803,7 +932,7 @@ class DataManager(QObject):
             cluster = label_to_cluster[label]
             image = self.samples.get(image_id)
             if image:
-                cluster.add_image(image)
+                self._assign_cluster(image, cluster)
 
         self.clustering_performed.emit()
         logging.info("Clustering completed successfully.")
@@ -868,7 +997,7 @@ class DataManager(QObject):
                 new_clusters[label] = self.create_cluster()
             image = self.samples.get(image_ids[i])
             if image:
-                new_clusters[label].add_image(image)
+                self._assign_cluster(image, new_clusters[label])
 
         # Delete the original cluster
         self.delete_cluster(cluster_id)
@@ -900,6 +1029,7 @@ class DataManager(QObject):
         """
         image = self.samples.pop(image_id, None)
         if image:
+            self._unmasked_count = None
             # Delete associated feature
             self.delete_features(image_id)
 
@@ -907,6 +1037,7 @@ class DataManager(QObject):
             for cluster in self.clusters.values():
                 if image in cluster.samples:
                     cluster.remove_image(image)
+            self._sample_cluster.pop(image_id, None)
 
             # Remove image from classes
             class_id = image.class_id
@@ -1,4 +1,5 @@
 # backend/workers.py
+import logging
 import os
 
 import cv2
@@ -129,3 +130,26 @@ class MaskLoaderWorker(QRunnable):
             self.signals.error.emit(error_msg)
         finally:
             self.signals.finished.emit()
+
+
+class SessionListWorker(QRunnable):
+    def __init__(self, session_manager, signals):
+        super().__init__()
+        self.session_manager = session_manager
+        self.signals = signals
+
+    @Slot()
+    def run(self):
+        try:
+            existing_sessions = self.session_manager.list_sessions()
+            names = [session.name for session in existing_sessions]
+            paths = [session.images_directory for session in existing_sessions]
+            ids = [session.id for session in existing_sessions]
+            initial_paths = [session.session_folder for session in existing_sessions]
+            self.signals.result.emit((names, paths, ids, initial_paths))
+        except Exception as e:
+            error_msg = f"Exception in SessionListWorker: {e}"
+            logging.exception("Exception in SessionListWorker")
+            self.signals.error.emit(error_msg)
+        finally:
+            self.signals.finished.emit()
@@ -1,21 +1,77 @@
-import pandas as pd
-import os
-import plotly.express as px
+import hashlib
+import logging
 import os
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from backend.config import (ANALYSIS_CARD_HEIGHT, ANALYSIS_CARD_WIDTH, ANALYSIS_NATIVE_CARDS,
+                            ANALYSIS_THUMBNAIL_SCALE, PLOT_CACHE_SIZE)
 
 
 class PlotGenerator:
     def __init__(self, data_manager):
         self.data_manager = data_manager
+        # (png path, html path) of recently generated plots, keyed by request and data hash
+        self._cache = OrderedDict()
+        # key of the plot currently written to each HTML path
+        self._path_keys = {}
+
+    @staticmethod
+    def _cache_key(chart_type, parameters, plot_name, *columns):
+        """Hashes the plot request together with the data it will be drawn from."""
+        digest = hashlib.blake2b(repr((chart_type, parameters, plot_name)).encode(), digest_size=16)
+        for column in columns:
+            array = np.asarray(column)
+            if array.dtype.kind in "biuf":
+                digest.update(array.tobytes())
+            else:
+                digest.update("\x1f".join(map(str, column)).encode())
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def _cached_paths(self, key):
+        paths = self._cache.get(key)
+        # a later plot with the same name may have overwritten the file
+        if paths is None or self._path_keys.get(paths[1]) != key or not os.path.exists(paths[1]):
+            return None
+        self._cache.move_to_end(key)
+        return paths
+
+    def _write_plot(self, fig, plot_name, key):
+        plot_html_path = os.path.abspath(os.path.join("temp", f"{plot_name}.html"))
+        plot_png_path = os.path.abspath(os.path.join("temp", f"{plot_name}.png"))
+        os.makedirs("temp", exist_ok=True)
+        fig.write_html(plot_html_path)
+        if ANALYSIS_NATIVE_CARDS:
+            # native cards draw their own thumbnail
+            plot_png_path = None
+        else:
+            # static thumbnail for the card, the HTML is only opened in the plot viewer
+            try:
+                fig.write_image(plot_png_path, width=ANALYSIS_CARD_WIDTH, height=ANALYSIS_CARD_HEIGHT,
+                                scale=ANALYSIS_THUMBNAIL_SCALE)
+            except (ValueError, RuntimeError) as e:  # kaleido missing or failed
+                logging.warning(f"Could not render the plot thumbnail, using the HTML view: {e}")
+                plot_png_path = None
+
+        self._path_keys[plot_html_path] = key
+        self._cache[key] = (plot_png_path, plot_html_path)
+        while len(self._cache) > PLOT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return plot_png_path, plot_html_path
 
     def generate_plot(self, chart_type, parameters, plot_name="plot"):
-        """Generates the specified chart type using Altair."""
+        """Generates the specified chart type using Plotly, reusing the files of identical earlier plots."""
 
         if chart_type == "histogram":
             x_data, group_data = parameters.get_data(self.data_manager)
+            key = self._cache_key(chart_type, parameters, plot_name, x_data, group_data)
+            cached = self._cached_paths(key)
+            if cached:
+                return cached
+
             df = pd.DataFrame({'x': x_data, 'group': group_data})
 
             if parameters.layered:
@@ -44,16 +100,14 @@ class PlotGenerator:
             if parameters.show_mean:
                 fig.add_vline(x=df['x'].mean(), line_width=3, line_dash="dash", line_color="red")
 
-
-            plot_html_path = os.path.abspath(os.path.join("temp", f"{plot_name}.html"))
-            plot_png_path = os.path.abspath(os.path.join("temp", f"{plot_name}.png"))
-            os.makedirs("temp", exist_ok=True)
-            fig.write_html(plot_html_path)
-            # Optionally generate PNG: fig.write_image(plot_png_path)
-
-            return plot_png_path, plot_html_path
+            return self._write_plot(fig, plot_name, key)
         elif chart_type == "scatter":
             x_data, y_data, size_data, color_data = parameters.get_data(self.data_manager)
+            key = self._cache_key(chart_type, parameters, plot_name, x_data, y_data, size_data, color_data)
+            cached = self._cached_paths(key)
+            if cached:
+                return cached
+
             df = pd.DataFrame({'x': x_data, 'y': y_data, 'size': size_data, 'group': color_data})
             trendline_mapping = {"global": "ols", "per group": "ols", "none": None}
 
@@ -69,13 +123,76 @@ class PlotGenerator:
                 title = f"{parameters.y_variable} vs {parameters.x_variable}"
             )
 
-            plot_html_path = os.path.abspath(os.path.join("temp", f"{plot_name}.html"))
-            plot_png_path = os.path.abspath(os.path.join("temp", f"{plot_name}.png"))
-            os.makedirs("temp", exist_ok=True)
-            fig.write_html(plot_html_path)
-            # (Optional PNG export)
-
-            return plot_png_path, plot_html_path
+            return self._write_plot(fig, plot_name, key)
 
         # Add other chart types here (e.g., scatter plot, etc.)
-        return None, None
\ No newline at end of file
+        return None, None
+
+    def generate_plot_native(self, chart_type, parameters):
+        """Computes the chart series as arrays for the native (non-web) analysis cards."""
+
+        if chart_type == "histogram":
+            x_data, group_data = parameters.get_data(self.data_manager)
+            x = np.asarray(x_data, dtype=float)
+            if x.size == 0:
+                return None
+
+            edges = np.histogram_bin_edges(x, bins=parameters.num_bins)
+            if parameters.layered:
+                groups = np.asarray(group_data)
+                names = list(dict.fromkeys(group_data))
+                subsets = [(name, x[groups == name]) for name in names]
+            else:
+                subsets = [(parameters.x_variable, x)]
+
+            series = []
+            for name, values in subsets:
+                counts = np.histogram(values, bins=edges)[0].astype(float)
+                if parameters.relative_frequency and values.size:
+                    counts *= 100.0 / values.size
+                series.append((name, counts))
+
+            return {
+                "type": "histogram",
+                "title": parameters.x_variable,
+                "x_label": parameters.x_variable,
+                "y_label": "percent" if parameters.relative_frequency else "count",
+                "edges": edges,
+                "series": series,
+                "mean": float(x.mean()) if parameters.show_mean else None,
+            }
+        elif chart_type == "scatter":
+            x_data, y_data, size_data, color_data = parameters.get_data(self.data_manager)
+            x = np.asarray(x_data, dtype=float)
+            y = np.asarray(y_data, dtype=float)
+            if x.size == 0:
+                return None
+
+            groups = np.asarray(color_data)
+            names = list(dict.fromkeys(color_data))
+            series = [(name, x[groups == name], y[groups == name]) for name in names]
+
+            # ordinary least squares lines, matching the Plotly "ols" trendline
+            trendlines = []
+            if parameters.trendline == "global":
+                fits = [(x, y)]
+            elif parameters.trendline == "per group":
+                fits = [(gx, gy) for _, gx, gy in series]
+            else:
+                fits = []
+            for fx, fy in fits:
+                if fx.size > 1 and np.ptp(fx) > 0:
+                    slope, intercept = np.polyfit(fx, fy, 1)
+                    x0, x1 = fx.min(), fx.max()
+                    trendlines.append((x0, slope * x0 + intercept, x1, slope * x1 + intercept))
+
+            return {
+                "type": "scatter",
+                "title": f"{parameters.y_variable} vs {parameters.x_variable}",
+                "x_label": parameters.x_variable,
+                "y_label": parameters.y_variable,
+                "series": series,
+                "trendlines": trendlines,
+            }
+
+        return None
\ No newline at end of file
@@ -31,12 +31,11 @@ class ClassesPresenter:
 
     def load_classes(self):
         """Loads existing classes and creates their cards and tree view items."""
-        for class_object in self.data_manager.classes.values():
-            preview_image_path = self._generate_class_preview(class_object.id)
-            card = self.classes_view_widget.create_class_card(class_object.name,
-                                                              class_object.id,
-                                                              class_object.color,
-                                                              preview_image_path)
+        class_objects = list(self.data_manager.classes.values())
+        self.classes_view_widget.create_class_cards(
+            [(class_object.name, class_object.id, class_object.color,
+              self._generate_class_preview(class_object.id)) for class_object in class_objects])
+        for class_object in class_objects:
             # Add the class to the tree view
             self.add_class_to_tree(class_object, parent_node=None)  # Add to root by default
 
@@ -82,8 +81,7 @@ class ClassesPresenter:
         class_object = self.data_manager.get_class(class_id)
         viewer = ClassClusterViewer(f"Class: {class_object.name}", self, self.classes_view_widget)  # Create viewer
         viewer.show()  # Show the viewer window
-        for image in class_object.samples:
-            viewer.add_card(image.id)
+        viewer.add_cards([image.id for image in class_object.samples])
         viewer.gallery_view.viewport().update()
         print(f"Showing viewer for class: {class_object.name}")
 
@@ -151,7 +149,7 @@ class ClassesPresenter:
         # Create the Flyout
         Flyout.make(
             view=view,
-            target=next((card for card in self.classes_view_widget.classes if card.class_id == class_id), None),
+            target=self.classes_view_widget.get_class_card(class_id),
             parent=self.classes_view_widget,
             aniType=FlyoutAnimationType.DROP_DOWN
         )
@@ -170,7 +168,7 @@ class ClassesPresenter:
         class_to_rename.name = new_class_name
 
         # Update the card label
-        card_to_update = next((card for card in self.classes_view_widget.classes if card.class_id == class_id), None)
+        card_to_update = self.classes_view_widget.get_class_card(class_id)
         if card_to_update:
             card_to_update.label.setText(new_class_name)
 
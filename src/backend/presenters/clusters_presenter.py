@@ -51,27 +51,31 @@ class ClustersPresenter(QObject):
         Args:
             cluster_ids (list): List of cluster IDs to load. If None, all clusters are loaded.
         """
-        if cluster_ids is None:
-            for cluster_id, cluster in self.data_manager.clusters.items():
-                preview_image_path = self._generate_cluster_preview(cluster_id)
-                card = self.clusters_view_widget.create_cluster_card(cluster_id, preview_image_path)
-                card.cluster_color = cluster.color
-                card.card_clicked.connect(self.on_card_clicked)
-                card.split_requested.connect(self.split_selected_cluster)
-                card.merge_requested.connect(self.merge_selected_clusters)
-                card.assign_class_requested.connect(self.assign_clusters_to_class)
-                card.cluster_double_clicked.connect(self.show_cluster_viewer)
-        else:
-            for cluster_id in cluster_ids:
-                cluster = self.data_manager.get_cluster(cluster_id)
-                preview_image_path = self._generate_cluster_preview(cluster_id)
-                card = self.clusters_view_widget.create_cluster_card(cluster_id, preview_image_path)
-                card.cluster_color = cluster.color
-                card.card_clicked.connect(self.on_card_clicked)
-                card.split_requested.connect(self.split_selected_cluster)
-                card.merge_requested.connect(self.merge_selected_clusters)
-                card.assign_class_requested.connect(self.assign_clusters_to_class)
-                card.cluster_double_clicked.connect(self.show_cluster_viewer)
+        self.clusters_view_widget.begin_batch()
+        try:
+            if cluster_ids is None:
+                for cluster_id, cluster in self.data_manager.clusters.items():
+                    preview_image_path = self._generate_cluster_preview(cluster_id)
+                    card = self.clusters_view_widget.create_cluster_card(cluster_id, preview_image_path)
+                    card.cluster_color = cluster.color
+                    card.card_clicked.connect(self.on_card_clicked)
+                    card.split_requested.connect(self.split_selected_cluster)
+                    card.merge_requested.connect(self.merge_selected_clusters)
+                    card.assign_class_requested.connect(self.assign_clusters_to_class)
+                    card.cluster_double_clicked.connect(self.show_cluster_viewer)
+            else:
+                for cluster_id in cluster_ids:
+                    cluster = self.data_manager.get_cluster(cluster_id)
+                    preview_image_path = self._generate_cluster_preview(cluster_id)
+                    card = self.clusters_view_widget.create_cluster_card(cluster_id, preview_image_path)
+                    card.cluster_color = cluster.color
+                    card.card_clicked.connect(self.on_card_clicked)
+                    card.split_requested.connect(self.split_selected_cluster)
+                    card.merge_requested.connect(self.merge_selected_clusters)
+                    card.assign_class_requested.connect(self.assign_clusters_to_class)
+                    card.cluster_double_clicked.connect(self.show_cluster_viewer)
+        finally:
+            self.clusters_view_widget.end_batch()
         self.data_manager._update_clusters_metadata()
 
     def start_analysis(self):
@@ -165,28 +169,27 @@ class ClustersPresenter(QObject):
     def select_card(self, card_id: str):
         """Selects the card with the given ID."""
         self.selected_card_ids.add(card_id)
-        # find the card with the given ID
-        for card in self.clusters_view_widget.clusters:
-            if card.cluster_id == card_id:
-                card.selected = True
-                card.update()
+        card = self.clusters_view_widget.get_cluster_card(card_id)
+        if card is not None:
+            card.selected = True
+            card.update()
 
     def deselect_card(self, card_id: str):
         """Deselects the card with the given ID."""
         self.selected_card_ids.discard(card_id)
-        for card in self.clusters_view_widget.clusters:
-            if card.cluster_id == card_id:
-                card.selected = False
-                card.update()
+        card = self.clusters_view_widget.get_cluster_card(card_id)
+        if card is not None:
+            card.selected = False
+            card.update()
 
     def clear_selection(self):
         """Clears the current selection."""
         # Update visuals for selected cards
         for selected_card_id in self.selected_card_ids:
-            for card in self.clusters_view_widget.clusters:
-                if card.cluster_id == selected_card_id:
-                    card.selected = False
-                    card.update()
+            card = self.clusters_view_widget.get_cluster_card(selected_card_id)
+            if card is not None:
+                card.selected = False
+                card.update()
         self.selected_card_ids.clear()
 
     def _generate_cluster_preview(self, cluster_id):
@@ -311,8 +314,7 @@ class ClustersPresenter(QObject):
         cluster = self.data_manager.get_cluster(cluster_id)
         viewer = ClassClusterViewer(f"Cluster: {cluster_id[:8]}", self, self.clusters_view_widget)  # Create viewer
         viewer.show()  # Show the viewer window
-        for image in cluster.samples:
-            viewer.add_card(image.id)
+        viewer.add_cards([image.id for image in cluster.samples])
         viewer.gallery_view.viewport().update()
 
     @Slot(str)
@@ -129,6 +129,20 @@ class GalleryModel(QAbstractListModel):
         self._images.append(image)
         self.endInsertRows()
 
+    def addImages(self, images):
+        """
+        Adds several images to the model in a single insertion.
+
+        Parameters:
+            images (list of Sample): Image objects to add.
+        """
+        if not images:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(images) - 1)
+        self._images.extend(images)
+        self.endInsertRows()
+
     def removeImage(self, row):
         """
         Removes an image from the model at the specified row.
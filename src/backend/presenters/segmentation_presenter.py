@@ -1,7 +1,7 @@
 ### backend/presenters/clusters_presenter.py
 import random
 
-from PySide6.QtCore import QEvent, Signal, QObject, Slot, QTimer
+from PySide6.QtCore import Signal, QObject, Slot, QTimer
 from qfluentwidgets import InfoBarIcon
 
 from UI.dialogs.progress_infobar import ProgressInfoBar